@@ -7,14 +7,19 @@ This is one of many possible interfaces for the core agent.
 
 import asyncio
 import json
-
-from prompt_toolkit import PromptSession
-from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.history import FileHistory
+import os
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from pygments import highlight
+from pygments.formatters import Terminal256Formatter
+from pygments.lexers.data import JsonLexer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
-from rich.syntax import Syntax
 from rich.text import Text
 
 from claude_agent_sdk import (
@@ -25,39 +30,195 @@ from claude_agent_sdk import (
     ResultMessage,
 )
 
-from donna_life_os.core import DonnaAgent, PermissionRequest
+from donna_life_os.core import DonnaAgent, PermissionCallback, PermissionRequest
+
+# prompt_toolkit is imported lazily inside the functions that need it - it's
+# a heavy import that only the interactive loop uses, and scripting consumers
+# of this module shouldn't pay for it at import time. (Rich stays
+# module-level: the pre-built renderables below need it, and claude_agent_sdk
+# is already loaded via donna_life_os.core.)
+if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
 
 
 # Global console for the CLI
-console = Console()
+# highlight=False skips Rich's auto-highlight regex pass on every print;
+# we style everything explicitly anyway
+console = Console(highlight=False)
+
+# Lazy singleton PromptSession - FileHistory re-reads the whole history file
+# and PromptSession init is heavy, so reuse one across run_chat invocations
+_prompt_session: "PromptSession[str] | None" = None
+
+
+def _get_prompt_session() -> "PromptSession[str]":
+    """Get the shared prompt session, creating it on first use."""
+    global _prompt_session
+    if _prompt_session is None:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import FileHistory, ThreadedHistory
+
+        # ThreadedHistory keeps history file I/O off the event loop
+        _prompt_session = PromptSession(
+            history=ThreadedHistory(FileHistory(".donna_history"))
+        )
+    return _prompt_session
+
+
+# Terminals known to support DEC Mode 2026 synchronized output
+_SYNC_TERMS = ("xterm", "wezterm", "alacritty", "kitty", "foot", "ghostty")
+
+
+def _supports_synchronized_output() -> bool:
+    """Check if the terminal supports synchronized output (DEC Mode 2026)."""
+    if os.environ.get("DONNA_SYNC_OUTPUT") == "0":
+        return False
+    term = os.environ.get("TERM", "")
+    return any(name in term for name in _SYNC_TERMS)
+
+
+# Computed once - the terminal doesn't change mid-session
+_SYNC_OUTPUT_ENABLED = _supports_synchronized_output()
+
+
+def _configure_stdout() -> None:
+    """
+    Switch stdout from line buffering to block buffering.
+
+    On a TTY stdout is line-buffered, so every newline Rich emits becomes its
+    own write() syscall. Block buffering lets a whole panel / coalesced flush
+    go out in a few large writes instead; _flush_stdout() is called at batch
+    boundaries (end of message, before the prompt) to push output out.
+    """
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError, OSError):
+        # Not a regular TextIOWrapper (tests, pipes, exotic shells) - fine as-is
+        pass
+
+
+def _flush_stdout() -> None:
+    """Flush buffered stdout at a batch boundary."""
+    sys.stdout.flush()
+
+
+@contextmanager
+def synchronized_output():
+    """
+    Wrap a batch of writes in DEC Mode 2026 synchronized-output escapes.
+
+    Supporting terminals treat everything between the escapes as one atomic
+    frame, eliminating tearing during rapid streaming. No-op on terminals
+    that don't advertise support (or when DONNA_SYNC_OUTPUT=0).
+    """
+    if not _SYNC_OUTPUT_ENABLED:
+        yield
+        return
+    sys.stdout.write("\x1b[?2026h")
+    try:
+        yield
+    finally:
+        sys.stdout.write("\x1b[?2026l")
+        sys.stdout.flush()
 
 
 # ============================================================================
 # Styled Output Functions for Agent Flow Visualization
 # ============================================================================
 
+# Pre-built panel titles - passing Text instead of a markup string skips
+# Rich's markup parser on every panel (tool calls can fire dozens of times
+# per turn)
+_THINKING_TITLE = Text("🧠 Thinking", style="magenta")
+_TOOL_RESULT_TITLE = Text("📤 Tool Result", style="green")
+_TOOL_ERROR_TITLE = Text("❌ Tool Error", style="red")
+
+
+@lru_cache(maxsize=64)
+def _tool_call_title(name: str) -> Text:
+    """Cached panel title per tool name (the set of tool names is small)."""
+    return Text(f"🔧 Tool: {name}", style="yellow")
+
+
 def print_thinking(text: str) -> None:
     """Display agent's reasoning/thinking in a subtle purple panel."""
     panel = Panel(
         Text(text, style="dim"),
-        title="[magenta]🧠 Thinking[/magenta]",
+        title=_THINKING_TITLE,
         border_style="dim magenta",
         padding=(0, 1),
     )
     console.print(panel)
 
 
-def print_tool_call(name: str, tool_input: dict) -> None:
+# Reusable encoder - avoids json.dumps re-resolving options on every tool call
+_JSON_ENCODER = json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+
+# Inputs under this size aren't worth a full Pygments lex pass
+_SYNTAX_HIGHLIGHT_MIN_CHARS = 200
+
+# Inputs over this size get serialized off the event loop so streaming
+# receive isn't blocked (e.g. a Write tool carrying a 100 KB body)
+_ASYNC_ENCODE_MIN_CHARS = 8192
+
+
+# Shared Pygments pipeline for tool-input JSON - building a Syntax object
+# per call re-initializes the lexer and re-runs the whole highlight pipeline
+# through Rich. Highlight straight to ANSI once and cache the result.
+_JSON_LEXER = JsonLexer(stripnl=False)
+_ANSI_FORMATTER = Terminal256Formatter(style="monokai")
+_ANSI_CACHE: OrderedDict[str, str] = OrderedDict()
+_ANSI_CACHE_MAX = 256
+_ANSI_CACHE_ENABLED = os.environ.get("DONNA_SYNTAX_CACHE") != "0"
+
+
+def _highlighted_json(input_str: str) -> Text:
+    """
+    Highlight a JSON string to ANSI, with a bounded LRU cache.
+
+    Agents often re-issue near-identical tool calls (same Grep pattern, same
+    Read path), so caching the highlighted ANSI skips both Pygments and
+    Rich's render on a hit. Keyed on the string itself (not its hash) to
+    avoid collisions; capped at 256 entries. Set DONNA_SYNTAX_CACHE=0 to
+    disable.
+    """
+    if not _ANSI_CACHE_ENABLED:
+        return Text.from_ansi(highlight(input_str, _JSON_LEXER, _ANSI_FORMATTER))
+
+    ansi = _ANSI_CACHE.get(input_str)
+    if ansi is not None:
+        _ANSI_CACHE.move_to_end(input_str)
+    else:
+        ansi = highlight(input_str, _JSON_LEXER, _ANSI_FORMATTER)
+        _ANSI_CACHE[input_str] = ansi
+        if len(_ANSI_CACHE) > _ANSI_CACHE_MAX:
+            _ANSI_CACHE.popitem(last=False)
+    return Text.from_ansi(ansi)
+
+
+async def print_tool_call(name: str, tool_input: dict) -> None:
     """Display a tool call with its inputs in a yellow panel."""
-    # Format the input as pretty JSON
-    input_str = json.dumps(tool_input, indent=2, default=str)
-    
-    # Use syntax highlighting for the JSON
-    syntax = Syntax(input_str, "json", theme="monokai", word_wrap=True)
-    
+    # Cheap size estimate - string values (file contents, commands) are what
+    # make a tool input big, and this avoids a throwaway full serialization
+    approx_size = sum(len(v) for v in tool_input.values() if isinstance(v, str))
+
+    # Format the input as pretty JSON; large payloads serialize in a worker
+    # thread so the event loop keeps receiving streamed tokens meanwhile
+    if approx_size > _ASYNC_ENCODE_MIN_CHARS:
+        input_str = await asyncio.to_thread(_JSON_ENCODER.encode, tool_input)
+    else:
+        input_str = _JSON_ENCODER.encode(tool_input)
+
+    # Syntax highlighting runs a Pygments tokenizer over the whole input;
+    # for tiny inputs the lex pass costs more than it's worth
+    if len(input_str) < _SYNTAX_HIGHLIGHT_MIN_CHARS:
+        body = Text(input_str)
+    else:
+        body = _highlighted_json(input_str)
+
     panel = Panel(
-        syntax,
-        title=f"[yellow]🔧 Tool: {name}[/yellow]",
+        body,
+        title=_tool_call_title(name),
         border_style="yellow",
         padding=(0, 1),
     )
@@ -81,23 +242,30 @@ def print_tool_result(content: str | list | None, is_error: bool = False) -> Non
     else:
         display_content = str(content)
     
-    # Truncate very long outputs
+    # Truncate very long outputs. Scan for the Nth newline instead of
+    # splitting - split/join would allocate every line of a large tool
+    # output just to display the first 20.
     max_lines = 20
-    lines = display_content.split("\n")
-    if len(lines) > max_lines:
-        display_content = "\n".join(lines[:max_lines]) + f"\n[dim]... ({len(lines) - max_lines} more lines)[/dim]"
+    idx = -1
+    for _ in range(max_lines):
+        idx = display_content.find("\n", idx + 1)
+        if idx < 0:
+            break
+    if idx >= 0:
+        hidden_lines = display_content.count("\n", idx + 1) + 1
+        display_content = display_content[:idx] + f"\n[dim]... ({hidden_lines} more lines)[/dim]"
     
     if is_error:
         panel = Panel(
             display_content,
-            title="[red]❌ Tool Error[/red]",
+            title=_TOOL_ERROR_TITLE,
             border_style="red",
             padding=(0, 1),
         )
     else:
         panel = Panel(
             display_content,
-            title="[green]📤 Tool Result[/green]",
+            title=_TOOL_RESULT_TITLE,
             border_style="green",
             padding=(0, 1),
         )
@@ -106,8 +274,12 @@ def print_tool_result(content: str | list | None, is_error: bool = False) -> Non
 
 def print_session_summary(message: ResultMessage) -> None:
     """Display session summary with cost and usage info."""
+    # Nothing to show - skip the list build and the Rich call entirely
+    if not (message.num_turns or message.duration_ms or message.total_cost_usd is not None):
+        return
+
     summary_parts = []
-    
+
     if message.num_turns:
         summary_parts.append(f"Turns: {message.num_turns}")
     if message.duration_ms:
@@ -120,23 +292,39 @@ def print_session_summary(message: ResultMessage) -> None:
         console.print(f"\n[dim]─── {summary_text} ───[/dim]")
 
 
+async def _confirm_bash(request: PermissionRequest) -> bool:
+    """Ask the user to confirm a Bash command."""
+    command = request.tool_input.get("command", "")
+    console.print(f"\n[yellow]Donna wants to run:[/yellow] {command}")
+    return Confirm.ask("[yellow]Allow this command?[/yellow]")
+
+
+async def _auto_allow(request: PermissionRequest) -> bool:
+    """Auto-allow tools that don't need confirmation."""
+    return True
+
+
+# Per-tool permission handlers - dict dispatch keeps this O(1) per tool call
+# and is easy to extend as confirmable tools are added
+_PERMISSION_HANDLERS: dict[str, PermissionCallback] = {
+    "Bash": _confirm_bash,
+}
+
+
 async def cli_permission_handler(request: PermissionRequest) -> bool:
     """
     CLI-specific permission handler using Rich prompts.
-    
+
+    Dispatches to a per-tool handler; tools without one are auto-allowed
+    (Read/Write are already auto-allowed in core).
+
     Args:
         request: The permission request from the agent
-        
+
     Returns:
         True if allowed, False if denied
     """
-    if request.tool_name == "Bash":
-        command = request.tool_input.get("command", "")
-        console.print(f"\n[yellow]Donna wants to run:[/yellow] {command}")
-        return Confirm.ask("[yellow]Allow this command?[/yellow]")
-    
-    # Auto-allow other tools (Read/Write are already auto-allowed in core)
-    return True
+    return await _PERMISSION_HANDLERS.get(request.tool_name, _auto_allow)(request)
 
 
 async def run_chat():
@@ -151,6 +339,8 @@ async def run_chat():
     - Graceful error handling
     - Clean exit on 'exit', 'quit', 'q', or Ctrl+C
     """
+    from prompt_toolkit.formatted_text import HTML
+
     # Display welcome panel
     console.print(Panel.fit(
         "[bold cyan]Donna[/bold cyan] - Your Life Operating System\n"
@@ -159,48 +349,96 @@ async def run_chat():
         border_style="cyan"
     ))
 
-    # Create prompt session with history for readline-style editing
+    # Shared prompt session with history for readline-style editing
     # Supports: arrow keys, Ctrl+A/E, Ctrl+K, command history, etc.
-    session: PromptSession[str] = PromptSession(
-        history=FileHistory(".donna_history")
-    )
+    session = _get_prompt_session()
 
     async def display_response(donna: DonnaAgent) -> ResultMessage | None:
         """Display streaming response from the agent."""
         has_text_response = False
         result_message = None
-        
-        async for message in donna.receive_response():
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    # Handle thinking/reasoning blocks
-                    if hasattr(block, "thinking") and block.thinking:
-                        print_thinking(block.thinking)
-                    
-                    # Handle tool use blocks
-                    elif isinstance(block, ToolUseBlock):
-                        print_tool_call(block.name, block.input)
-                    
-                    # Handle tool result blocks
-                    elif isinstance(block, ToolResultBlock):
-                        print_tool_result(block.content, block.is_error)
-                    
-                    # Handle text blocks (the actual response)
-                    elif isinstance(block, TextBlock):
-                        if not has_text_response:
-                            console.print("\n[bold blue]Donna:[/bold blue] ", end="")
-                            has_text_response = True
-                        # soft_wrap=True prevents awkward word-boundary breaks during streaming
-                        console.print(block.text, end="", soft_wrap=True)
-            
-            # Capture result message for summary
-            elif isinstance(message, ResultMessage):
-                result_message = message
-        
+        # Queue for streamed text fragments - console.print parses markup and
+        # computes ANSI on every call, so rendering per-fragment dominates the
+        # streaming path. Fragments are coalesced on a ~16ms timer (one frame
+        # at 60fps) so a burst of deltas becomes a single render.
+        text_queue: asyncio.Queue[str] = asyncio.Queue()
+
+        def flush_text() -> None:
+            nonlocal has_text_response
+            parts: list[str] = []
+            while not text_queue.empty():
+                parts.append(text_queue.get_nowait())
+            if not parts:
+                return
+            with synchronized_output():
+                if not has_text_response:
+                    console.print("\n[bold blue]Donna:[/bold blue] ", end="")
+                    has_text_response = True
+                # soft_wrap=True prevents awkward word-boundary breaks during streaming
+                console.print("".join(parts), end="", soft_wrap=True)
+
+        async def _flusher() -> None:
+            """Render queued fragments once per frame instead of per delta."""
+            while True:
+                await asyncio.sleep(0.016)
+                flush_text()
+
+        async def _handle_tool_use(block: ToolUseBlock) -> None:
+            flush_text()
+            await print_tool_call(block.name, block.input)
+
+        def _handle_tool_result(block: ToolResultBlock) -> None:
+            flush_text()
+            print_tool_result(block.content, block.is_error)
+
+        def _handle_text(block: TextBlock) -> None:
+            text_queue.put_nowait(block.text)
+
+        # Per-block-type dispatch - one dict lookup per block instead of an
+        # isinstance chain. Thinking blocks have no stable SDK type to key on,
+        # so they stay as the attribute-probe fallback.
+        block_handlers = {
+            TextBlock: _handle_text,
+            ToolUseBlock: _handle_tool_use,
+            ToolResultBlock: _handle_tool_result,
+        }
+
+        # Localize hot-loop globals
+        assistant_message_type = AssistantMessage
+        result_message_type = ResultMessage
+
+        flusher_task = asyncio.create_task(_flusher())
+
+        try:
+            async for message in donna.receive_response():
+                message_type = type(message)
+                if message_type is assistant_message_type:
+                    for block in message.content:
+                        handler = block_handlers.get(type(block))
+                        if handler is not None:
+                            # Tool-use handling is async (large inputs
+                            # serialize off-loop); the rest stays sync
+                            result = handler(block)
+                            if result is not None:
+                                await result
+                        # Handle thinking/reasoning blocks
+                        elif getattr(block, "thinking", None):
+                            flush_text()
+                            print_thinking(block.thinking)
+
+                # Capture result message for summary
+                elif message_type is result_message_type:
+                    result_message = message
+        finally:
+            # Stop the timer and drain whatever is still queued
+            flusher_task.cancel()
+            flush_text()
+
         # Add newline after text response
         if has_text_response:
             console.print()
-        
+        _flush_stdout()
+
         return result_message
 
     try:
@@ -217,6 +455,7 @@ async def run_chat():
                 # Get user input with readline-style editing
                 try:
                     console.print()  # Newline before prompt
+                    _flush_stdout()
                     user_input = await session.prompt_async(
                         HTML("<ansigreen><b>You:</b></ansigreen> ")
                     )
@@ -227,7 +466,7 @@ async def run_chat():
                     break
 
                 # Check for exit commands
-                if not user_input or user_input.lower() in ["exit", "quit", "q"]:
+                if not user_input or (len(user_input) <= 4 and user_input.lower() in _EXIT_COMMANDS):
                     await _update_context_and_exit(donna)
                     break
 
@@ -253,9 +492,21 @@ async def run_chat():
         )
 
 
+# Commands that end the session - frozenset for O(1) membership, with a
+# length guard at the call site so normal messages skip the .lower() copy
+_EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+
+
+# Pre-encoded ANSI for the fixed exit-path strings - no point running the
+# full Rich pipeline (markup parse, style resolution, wrapping) for these
+_UPDATING_ANSI = "\n\x1b[2mUpdating context...\x1b[0m\n"
+_GOODBYE_ANSI = "\x1b[33mGoodbye!\x1b[0m\n"
+
+
 async def _update_context_and_exit(donna: DonnaAgent) -> None:
     """Update context file and say goodbye."""
-    console.print("\n[dim]Updating context...[/dim]")
+    sys.stdout.write(_UPDATING_ANSI)
+    sys.stdout.flush()
     await donna.send_message(
         "[SYSTEM] The user is ending this session. "
         "Please update ~/donna-data/current_context.md based on this conversation. "
@@ -263,10 +514,10 @@ async def _update_context_and_exit(donna: DonnaAgent) -> None:
         "and remove any items that are no longer relevant. Keep it focused on 5-7 items max. "
         "Do this silently without explaining what you're doing."
     )
-    # Consume the response without displaying
-    async for _ in donna.receive_response():
-        pass
-    console.print("[yellow]Goodbye![/yellow]")
+    # Consume the response without displaying (or logging) it
+    await donna.drain()
+    sys.stdout.write(_GOODBYE_ANSI)
+    sys.stdout.flush()
 
 
 def main():
@@ -274,7 +525,20 @@ def main():
     Entry point for the CLI chat agent.
 
     Runs the async chat loop and handles any keyboard interrupts.
+
+    Uses uvloop when available - the chat loop is dominated by many small
+    awaits (SDK stream iteration, prompt input, subprocess IO), where uvloop
+    gives a 2-4x event-loop throughput improvement over stock asyncio.
     """
+    _configure_stdout()
+
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        # uvloop is optional (and unavailable on Windows) - stock asyncio works fine
+        pass
+
     try:
         asyncio.run(run_chat())
     except KeyboardInterrupt:
@@ -48,7 +48,8 @@ ALLOWED_TOOLS = [
 
 # Tools that are auto-allowed without user confirmation
 # These are safe, read-only or ~/donna-data-focused operations
-AUTO_ALLOWED_TOOLS = [
+# frozenset: membership is checked on every single tool call
+AUTO_ALLOWED_TOOLS = frozenset({
     "Read",
     "Write",
     "Edit",
@@ -56,7 +57,7 @@ AUTO_ALLOWED_TOOLS = [
     "Glob",
     "Skill",
     "Task",
-]
+})
 
 # =============================================================================
 # Data Paths
@@ -6,9 +6,14 @@ Uses async event-based permission handling for flexibility.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
+import queue
 import shutil
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,8 +21,20 @@ from typing import AsyncGenerator, Callable, Awaitable, Dict, Any
 from zoneinfo import ZoneInfo
 import yaml
 
+# Prefer libyaml's C loader - yaml.safe_load silently falls back to the
+# pure-Python scanner, which is orders of magnitude slower for small docs
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Package-relative locations referenced on every session start
+_MODULE_DIR = Path(__file__).parent
+_PROMPT_PATH = _MODULE_DIR / "prompt.md"
+_PACKAGE_DIR_STR = str(_MODULE_DIR)
+
 from tzlocal import get_localzone
 
 from claude_agent_sdk import (
@@ -46,48 +63,139 @@ from donna_life_os.config import (
 )
 
 
+def _fmt_text_block(block: TextBlock) -> dict | None:
+    """Format a text block for logging, dropping empty/placeholder text."""
+    if block.text and block.text.strip() and block.text.strip() != "(no content)":
+        return {"type": "text", "text": block.text}
+    return None
+
+
+def _fmt_tool_use_block(block: ToolUseBlock) -> dict:
+    """Format a tool-use block for logging."""
+    return {
+        "type": "tool_use",
+        "id": block.id,
+        "name": block.name,
+        "input": block.input,
+    }
+
+
+def _fmt_tool_result_block(block: ToolResultBlock) -> dict:
+    """Format a tool-result block for logging."""
+    return {
+        "type": "tool_result",
+        "tool_use_id": block.tool_use_id,
+        "content": block.content,
+        "is_error": block.is_error,
+    }
+
+
+def _fmt_other_block(block) -> dict | None:
+    """Fallback formatter - catches thinking blocks, drops anything else."""
+    thinking = getattr(block, "thinking", None)
+    if thinking:
+        return {"type": "thinking", "thinking": thinking}
+    return None
+
+
+# Per-block-type log formatters - one dict lookup per block instead of an
+# isinstance/hasattr chain at streaming rate
+_BLOCK_FORMATTERS = {
+    TextBlock: _fmt_text_block,
+    ToolUseBlock: _fmt_tool_use_block,
+    ToolResultBlock: _fmt_tool_result_block,
+}
+
+# Shared encoder for log entries - json.dumps builds a new JSONEncoder on
+# every call; compact separators also shave bytes off each written line
+_encode_log_entry = json.JSONEncoder(
+    default=str, ensure_ascii=False, separators=(",", ":")
+).encode
+
+
 class ConversationLogger:
-    """Streams conversation log entries to a JSONL file as they happen."""
+    """
+    Streams conversation log entries to a JSONL file as they happen.
+
+    Entries are handed to a background writer thread through a queue, so the
+    event loop never blocks on file I/O. The previous implementation opened,
+    wrote, and closed the file per entry - one syscall round-trip for every
+    assistant/tool block in a streaming response.
+    """
+
+    # How long buffered entries may sit before being flushed to disk
+    _FLUSH_INTERVAL = 0.05
 
     def __init__(self, log_dir: Path):
         self.log_dir = log_dir
         self.log_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = log_dir / f"{timestamp}.jsonl"
+        # Timestamp string cached per wall-clock second - at streaming rates
+        # many entries land in the same second and isoformat() isn't free
+        self._ts_sec = 0
+        self._ts_str = ""
+        self._fh = open(self.log_file, "ab", buffering=65536)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="donna-log-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _write_loop(self) -> None:
+        """Drain queued entries to the buffered file handle (writer thread)."""
+        last_flush = time.monotonic()
+        dirty = False
+        while True:
+            try:
+                line = self._queue.get(timeout=self._FLUSH_INTERVAL)
+            except queue.Empty:
+                # Idle: flush what the last batch left buffered, so the file
+                # never trails the session by more than ~the interval (a
+                # blocking get would leave the tail unflushed until the
+                # *next* entry arrived - invisible to tail -f, lost on crash)
+                if dirty:
+                    self._fh.flush()
+                    dirty = False
+                continue
+            if line is None:
+                break
+            self._fh.write(line)
+            dirty = True
+            now = time.monotonic()
+            if now - last_flush > self._FLUSH_INTERVAL:
+                self._fh.flush()
+                dirty = False
+                last_flush = now
+        self._fh.flush()
+        self._fh.close()
+
+    def close(self) -> None:
+        """Stop the writer thread, flushing anything still queued."""
+        self._queue.put(None)
+        self._writer.join(timeout=2)
 
     def log(self, entry_type: str, data: dict):
+        now_s = int(time.time())
+        if now_s != self._ts_sec:
+            self._ts_sec = now_s
+            self._ts_str = datetime.fromtimestamp(now_s).isoformat()
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._ts_str,
             "type": entry_type,
             **data,
         }
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        self._queue.put((_encode_log_entry(entry) + "\n").encode())
 
     def log_message(self, message):
         """Log an AssistantMessage or ResultMessage from the SDK."""
         if isinstance(message, AssistantMessage):
-            blocks = []
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    if block.text and block.text.strip() and block.text.strip() != "(no content)":
-                        blocks.append({"type": "text", "text": block.text})
-                elif hasattr(block, "thinking") and block.thinking:
-                    blocks.append({"type": "thinking", "thinking": block.thinking})
-                elif isinstance(block, ToolUseBlock):
-                    blocks.append({
-                        "type": "tool_use",
-                        "id": block.id,
-                        "name": block.name,
-                        "input": block.input,
-                    })
-                elif isinstance(block, ToolResultBlock):
-                    blocks.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.tool_use_id,
-                        "content": block.content,
-                        "is_error": block.is_error,
-                    })
+            blocks = [
+                entry
+                for block in message.content
+                if (entry := _BLOCK_FORMATTERS.get(type(block), _fmt_other_block)(block))
+                is not None
+            ]
             if blocks:
                 self.log("assistant_message", {"content": blocks})
         elif isinstance(message, ResultMessage):
@@ -99,87 +207,169 @@ class ConversationLogger:
             })
 
 
+# mtime+size-validated text cache for the small context/preferences files
+# that get re-read on every prompt build. A stat per call replaces a full
+# read, and edits on disk (by Donna or the user) still invalidate
+# immediately; checking size as well as mtime catches same-timestamp
+# rewrites on coarse-mtime filesystems.
+_text_cache: dict[str, tuple[int, int, str]] = {}
+
+
+def _read_text_cached(path: Path) -> str | None:
+    """
+    Read a file's text, cached against its mtime and size.
+
+    Returns:
+        File contents, or None if the file doesn't exist.
+    """
+    key = str(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _text_cache.pop(key, None)
+        return None
+
+    cached = _text_cache.get(key)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+    ):
+        return cached[2]
+
+    # Binary read + one decode; Path.read_text would re-wrap the path and
+    # layer a TextIOWrapper over the same bytes. All of these files are
+    # UTF-8 markdown written by Donna herself.
+    with open(key, "rb") as f:
+        text = f.read().decode("utf-8")
+    _text_cache[key] = (stat.st_mtime_ns, stat.st_size, text)
+    return text
+
+
 def load_current_context() -> str:
     """
     Load the current context file contents.
-    
+
     Returns:
         Full contents of current_context.md, or empty string if file doesn't exist.
     """
-    if not CURRENT_CONTEXT_FILE.exists():
-        return ""
-    return CURRENT_CONTEXT_FILE.read_text()
+    return _read_text_cached(CURRENT_CONTEXT_FILE) or ""
+
+
+# Greeting prompts - the onboarding one is fully constant and the returning-
+# user one only varies by name, so both live at module scope instead of
+# being re-allocated inside generate_greeting_prompt each session
+_ONBOARDING_PROMPT = """[SYSTEM - ONBOARDING]
+This is a new user. The ~/donna-data folder structure has been initialized.
+Use the new-user-onboarding skill to guide them through a natural introduction. I am now going to invoke the new-user-onboarding skill."""
+
+_GREETING_TEMPLATE = """[SYSTEM - GREETING]
+Start this conversation by greeting {name} naturally and asking what's on their mind.
+
+Keep it conversational and brief - just a friendly opener that acknowledges their context.
+You can suggest a few things they might want to talk about based on their active context
+(from current_context.md, already loaded in your system prompt), or offer to do a check-in,
+capture something new, or just chat. Make it feel natural, not like a menu. One or two sentences max.
+
+Don't use bullet points or numbered lists - just speak naturally."""
 
 
 def generate_greeting_prompt() -> str:
     """
     Generate a prompt for the agent to create a natural greeting.
-    
+
     For new users, triggers the onboarding skill.
     For returning users, generates a contextual greeting.
-    
+
     Returns:
         A system prompt that asks the agent to greet the user naturally.
     """
+    # Load preferences once and share the parse across the checks below
+    prefs = load_user_info_and_preferences()
+
     # Check if this is a new user - trigger onboarding skill
-    if is_new_user():
+    if is_new_user(prefs):
         setup_donna_data_directory()  # Ensure data folder exists before onboarding
-        return """[SYSTEM - ONBOARDING]
-This is a new user. The ~/donna-data folder structure has been initialized.
-Use the new-user-onboarding skill to guide them through a natural introduction. I am now going to invoke the new-user-onboarding skill."""
-    
+        return _ONBOARDING_PROMPT
+
     # Returning user - normal greeting
-    user_name = get_user_name()
-    
-    return f"""[SYSTEM - GREETING]
-Start this conversation by greeting {user_name} naturally and asking what's on their mind.
+    return _GREETING_TEMPLATE.format(name=get_user_name(prefs))
 
-Keep it conversational and brief - just a friendly opener that acknowledges their context.
-You can suggest a few things they might want to talk about based on their active context
-(from current_context.md, already loaded in your system prompt), or offer to do a check-in,
-capture something new, or just chat. Make it feel natural, not like a menu. One or two sentences max.
 
-Don't use bullet points or numbered lists - just speak naturally."""
+@functools.lru_cache(maxsize=8)
+def _parse_preferences(content: str) -> Dict[str, Any]:
+    """
+    Parse the YAML frontmatter of a preferences file.
+
+    Memoized on the raw text so is_new_user/get_user_name/get_user_timezone
+    share one parse per file version. Callers must treat the result as
+    read-only.
+    """
+    if content.startswith("---"):
+        # Slice out just the frontmatter - split("---", 2) would also
+        # materialize a copy of the entire body after the closing fence
+        end = content.find("---", 3)
+        if end != -1:
+            try:
+                return yaml.load(content[3:end], Loader=_YamlLoader) or {}
+            except yaml.YAMLError:
+                return {}
+    return {}
 
 
 def load_user_info_and_preferences() -> Dict[str, Any]:
     """
     Load user info and preferences from the preferences file.
-    
+
     Returns:
         Dictionary of user info and preferences, or empty dict if file doesn't exist.
     """
-    if not USER_PREFERENCES_FILE.exists():
+    content = _read_text_cached(USER_PREFERENCES_FILE)
+    if content is None:
         return {}
-    
-    content = USER_PREFERENCES_FILE.read_text()
-    
-    # Parse YAML frontmatter
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            try:
-                return yaml.safe_load(parts[1]) or {}
-            except yaml.YAMLError:
-                return {}
-    return {}
+    return _parse_preferences(content)
 
 
-def get_user_name() -> str:
-    """Get the user's name from preferences, or 'there' as fallback."""
-    prefs = load_user_info_and_preferences()
+def get_user_name(prefs: Dict[str, Any] | None = None) -> str:
+    """
+    Get the user's name from preferences, or 'there' as fallback.
+
+    Pass an already-loaded prefs dict to avoid a redundant load.
+    """
+    if prefs is None:
+        prefs = load_user_info_and_preferences()
     return prefs.get("name", "there")
 
 
-def get_user_timezone() -> str | None:
-    """Get the user's timezone from preferences, if set."""
-    prefs = load_user_info_and_preferences()
+def get_user_timezone(prefs: Dict[str, Any] | None = None) -> str | None:
+    """
+    Get the user's timezone from preferences, if set.
+
+    Pass an already-loaded prefs dict to avoid a redundant load.
+    """
+    if prefs is None:
+        prefs = load_user_info_and_preferences()
     tz = prefs.get("timezone")
     if tz and tz != "TBD":
         return tz
     return None
 
 
+@functools.lru_cache(maxsize=64)
+def _zoneinfo_or_none(name: str) -> ZoneInfo | None:
+    """
+    Resolve an IANA timezone name, caching failures too.
+
+    ZoneInfo caches successful constructions internally, but an invalid
+    name (a malformed browser value, "TBD", ...) pays the tzdata lookup
+    and exception on every call - memoize both outcomes.
+    """
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
 def get_effective_timezone(client_timezone: str | None = None) -> ZoneInfo:
     """
     Get the effective timezone to use, with fallback chain:
@@ -195,23 +385,50 @@ def get_effective_timezone(client_timezone: str | None = None) -> ZoneInfo:
     """
     # Try client timezone first
     if client_timezone:
-        try:
-            return ZoneInfo(client_timezone)
-        except Exception:
-            pass
+        tz = _zoneinfo_or_none(client_timezone)
+        if tz is not None:
+            return tz
 
     # Try user's stored preference
     user_tz = get_user_timezone()
     if user_tz:
-        try:
-            return ZoneInfo(user_tz)
-        except Exception:
-            pass
+        tz = _zoneinfo_or_none(user_tz)
+        if tz is not None:
+            return tz
 
     # Fall back to system timezone
     return get_localzone()
 
 
+# Fixed English day/month names for date-context formatting. Indexing these
+# replaces ~30 locale-aware strftime calls per prompt build, and integer
+# f-string formatting never produces the leading zeros strftime needed
+# stripping afterwards.
+_DAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday",
+)
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def _format_date_readable(d: datetime) -> str:
+    """Format like 'March 5, 2026' (no leading zero on the day)."""
+    return f"{_MONTH_NAMES[d.month - 1]} {d.day}, {d.year}"
+
+
+def _format_date_iso(d: datetime) -> str:
+    """Format like '2026-03-05'."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+# Date-context strings only change when the minute rolls over; cache a few
+# so multi-tab / reconnect bursts don't redo the formatting work
+_date_context_cache: dict[tuple[str, int], str] = {}
+_DATE_CONTEXT_CACHE_MAX = 8
+
+
 def generate_date_context(timezone: ZoneInfo | None = None) -> str:
     """
     Generate a date/time context string for the system prompt.
@@ -221,6 +438,9 @@ def generate_date_context(timezone: ZoneInfo | None = None) -> str:
     - Next 7 days with day names
     - Reference points (1 week, 2 weeks, end of month)
 
+    Memoized at (timezone, minute) granularity - repeated session starts
+    within the same minute reuse the prebuilt string.
+
     Args:
         timezone: Timezone to use. If None, uses system timezone.
 
@@ -230,9 +450,14 @@ def generate_date_context(timezone: ZoneInfo | None = None) -> str:
     tz = timezone or get_localzone()
     now = datetime.now(tz)
 
-    # Format current time
-    day_name = now.strftime("%A")
-    date_readable = now.strftime("%B %d, %Y").replace(" 0", " ")  # Remove leading zero
+    cache_key = (str(tz), int(now.timestamp()) // 60)
+    cached = _date_context_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Format current time (strftime only where the locale/timezone matters)
+    day_name = _DAY_NAMES[now.weekday()]
+    date_readable = _format_date_readable(now)
     time_readable = now.strftime("%I:%M %p").lstrip("0")  # Remove leading zero from hour
     tz_abbrev = now.strftime("%Z")
     tz_name = str(tz)
@@ -247,69 +472,70 @@ def generate_date_context(timezone: ZoneInfo | None = None) -> str:
     ]
 
     # Generate next 7 days
+    past_this_week = 6 - now.weekday()
     for i in range(1, 8):
         future_date = now + timedelta(days=i)
-        future_day = future_date.strftime("%A")
-        future_date_readable = future_date.strftime("%B %d, %Y").replace(" 0", " ")
-        future_iso = future_date.strftime("%Y-%m-%d")
+        future_day = _DAY_NAMES[future_date.weekday()]
 
         if i == 1:
             label = f"Tomorrow ({future_day[:3]})"
+        elif i > past_this_week:  # Past this week's same day
+            label = f"Next {future_day}"
         else:
-            # Prefix with "Next" if it's past this week
             label = future_day
-            if i > (6 - now.weekday()):  # Past this week's same day
-                label = f"Next {future_day}"
 
-        lines.append(f"{label + ':':<18} {future_date_readable} [{future_iso}]")
+        lines.append(
+            f"{label + ':':<18} {_format_date_readable(future_date)}"
+            f" [{_format_date_iso(future_date)}]"
+        )
 
     # Reference points
     lines.append("")
     lines.append("─── Reference Points ───")
 
-    # 1 week from now
-    one_week = now + timedelta(days=7)
-    one_week_day = one_week.strftime("%A")
-    one_week_readable = one_week.strftime("%B %d, %Y").replace(" 0", " ")
-    one_week_iso = one_week.strftime("%Y-%m-%d")
-    lines.append(f"{'1 week from now:':<18} {one_week_day}, {one_week_readable} [{one_week_iso}]")
-
-    # 2 weeks from now
-    two_weeks = now + timedelta(days=14)
-    two_weeks_day = two_weeks.strftime("%A")
-    two_weeks_readable = two_weeks.strftime("%B %d, %Y").replace(" 0", " ")
-    two_weeks_iso = two_weeks.strftime("%Y-%m-%d")
-    lines.append(f"{'2 weeks from now:':<18} {two_weeks_day}, {two_weeks_readable} [{two_weeks_iso}]")
-
-    # End of month
     if now.month == 12:
         end_of_month = now.replace(year=now.year + 1, month=1, day=1) - timedelta(days=1)
     else:
         end_of_month = now.replace(month=now.month + 1, day=1) - timedelta(days=1)
-    end_of_month_day = end_of_month.strftime("%A")
-    end_of_month_readable = end_of_month.strftime("%B %d, %Y").replace(" 0", " ")
-    end_of_month_iso = end_of_month.strftime("%Y-%m-%d")
-    lines.append(f"{'End of month:':<18} {end_of_month_day}, {end_of_month_readable} [{end_of_month_iso}]")
 
-    return "\n".join(lines)
+    for label, ref_date in (
+        ("1 week from now:", now + timedelta(days=7)),
+        ("2 weeks from now:", now + timedelta(days=14)),
+        ("End of month:", end_of_month),
+    ):
+        lines.append(
+            f"{label:<18} {_DAY_NAMES[ref_date.weekday()]},"
+            f" {_format_date_readable(ref_date)} [{_format_date_iso(ref_date)}]"
+        )
+
+    result = "\n".join(lines)
+
+    # Evict oldest entries (insertion order) to keep the cache tiny
+    if len(_date_context_cache) >= _DATE_CONTEXT_CACHE_MAX:
+        _date_context_cache.pop(next(iter(_date_context_cache)))
+    _date_context_cache[cache_key] = result
+
+    return result
 
 
-def is_new_user() -> bool:
+def is_new_user(prefs: Dict[str, Any] | None = None) -> bool:
     """
     Check if this is a fresh user (no preferences set).
 
+    Pass an already-loaded prefs dict to avoid a redundant load.
+
     Returns:
         True if user_info_and_preferences.md doesn't exist, is empty, or has no name field.
     """
-    if not USER_PREFERENCES_FILE.exists():
-        return True
-    content = USER_PREFERENCES_FILE.read_text().strip()
-    if not content:
-        return True
-    prefs = load_user_info_and_preferences()
+    if prefs is None:
+        prefs = load_user_info_and_preferences()
     return not prefs.get("name")  # No name = new user
 
 
+# Ships inside the package - resolve once instead of per greeting
+_ONBOARDING_TEMPLATE_PATH = _MODULE_DIR / ".claude/skills/onboarding/template-donna-data"
+
+
 def setup_donna_data_directory() -> bool:
     """
     Copy template folder for new users.
@@ -320,43 +546,105 @@ def setup_donna_data_directory() -> bool:
     Returns:
         True if folder was created, False if it already existed.
     """
-    template_path = Path(__file__).parent / ".claude/skills/onboarding/template-donna-data"
-    if not DONNA_DATA_DIR.exists() and template_path.exists():
-        shutil.copytree(template_path, DONNA_DATA_DIR)
+    if not DONNA_DATA_DIR.exists() and _ONBOARDING_TEMPLATE_PATH.exists():
+        shutil.copytree(_ONBOARDING_TEMPLATE_PATH, DONNA_DATA_DIR)
         return True
     return False
 
 
+# Shared permission results - these are immutable value objects, so hot
+# paths can return one instance instead of allocating per tool call. A fresh
+# PermissionResultDeny is only built when the message differs from the
+# default.
+_ALLOW = PermissionResultAllow(behavior="allow")
+_DENY_DEFAULT_MESSAGE = "User denied the request"
+_DENY_DEFAULT = PermissionResultDeny(behavior="deny", message=_DENY_DEFAULT_MESSAGE)
+_DENY_DECLINED = PermissionResultDeny(behavior="deny", message="User declined the request")
+
+
 @dataclass
 class PermissionRequest:
     """
     Emitted when the agent needs permission for a tool.
-    
+
     The interface receives this and should call allow() or deny() to respond.
     """
     tool_name: str
     tool_input: dict
-    _response_future: asyncio.Future = field(default_factory=lambda: asyncio.get_event_loop().create_future())
-    
+    # Created lazily on the running loop - asyncio.get_event_loop() in a
+    # default_factory is deprecated on 3.12+ and can bind the future to the
+    # wrong loop when requests are constructed off-loop (e.g. worker threads)
+    _response_future: asyncio.Future | None = field(default=None, repr=False)
+
+    def _future(self) -> asyncio.Future:
+        """Get the response future, creating it on the running loop."""
+        if self._response_future is None:
+            self._response_future = asyncio.get_running_loop().create_future()
+        return self._response_future
+
     async def allow(self) -> None:
         """Allow the tool to execute."""
-        if not self._response_future.done():
-            self._response_future.set_result(PermissionResultAllow(behavior="allow"))
-    
-    async def deny(self, message: str = "User denied the request") -> None:
+        future = self._future()
+        if not future.done():
+            future.set_result(_ALLOW)
+
+    async def deny(self, message: str = _DENY_DEFAULT_MESSAGE) -> None:
         """Deny the tool execution with an optional message."""
-        if not self._response_future.done():
-            self._response_future.set_result(PermissionResultDeny(behavior="deny", message=message))
-    
+        future = self._future()
+        if not future.done():
+            if message == _DENY_DEFAULT_MESSAGE:
+                result = _DENY_DEFAULT
+            else:
+                result = PermissionResultDeny(behavior="deny", message=message)
+            future.set_result(result)
+
     async def wait_for_response(self) -> PermissionResultAllow | PermissionResultDeny:
         """Wait for and return the permission response."""
-        return await self._response_future
+        return await self._future()
 
 
 def load_system_prompt() -> str:
-    """Load the system prompt from prompt.md."""
-    prompt_path = Path(__file__).parent / "prompt.md"
-    return prompt_path.read_text()
+    """
+    Load the system prompt from prompt.md.
+
+    Served from the mtime-validated text cache - repeated agent sessions
+    skip the disk read, but edits to prompt.md (e.g. while iterating on
+    Donna's personality in a live CLI session) are picked up immediately.
+    """
+    return _read_text_cached(_PROMPT_PATH) or ""
+
+
+@functools.lru_cache(maxsize=4)
+def _preferences_section(prefs_content: str) -> str:
+    """Pre-formatted preferences section, cached per file version."""
+    return f"""
+
+## User Info and Preferences (from user_info_and_preferences.md)
+
+IMPORTANT: Use the `name` from frontmatter when addressing the user. Use the `communication_style` to adjust your personality.
+
+{prefs_content}
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _context_section(current_context: str) -> str:
+    """Pre-formatted current-context section, cached per file version."""
+    if current_context.strip():
+        return f"""
+
+## Current Active Context (from current_context.md)
+
+These are the topics/items the user is currently focused on. Reference these when relevant:
+
+{current_context}
+"""
+    return """
+
+## Current Active Context
+
+No active context items. This may be a new user or a fresh start.
+"""
 
 
 def build_full_system_prompt(client_timezone: str | None = None) -> str:
@@ -379,55 +667,84 @@ def build_full_system_prompt(client_timezone: str | None = None) -> str:
     date_context = generate_date_context(timezone)
 
     # Load user preferences
-    prefs_content = ""
-    if USER_PREFERENCES_FILE.exists():
-        prefs_content = USER_PREFERENCES_FILE.read_text()
+    prefs_content = _read_text_cached(USER_PREFERENCES_FILE) or ""
 
     # Load current context
     current_context = load_current_context()
 
-    # Build the full prompt with context
-    full_prompt = base_prompt
-
-    # Add date/time context first (most important for temporal reasoning)
-    full_prompt += f"""
-
-{date_context}
-"""
-
-    # Add user info and preferences section
-    if prefs_content:
-        full_prompt += f"""
+    # All four inputs come from caches, so back-to-back session starts pass
+    # the very same string objects and the composed prompt is returned by
+    # reference instead of re-joined
+    return _compose_prompt(
+        base_prompt,
+        date_context,
+        _preferences_section(prefs_content) if prefs_content else "",
+        _context_section(current_context),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _compose_prompt(
+    base_prompt: str,
+    date_context: str,
+    prefs_section: str,
+    context_section: str,
+) -> str:
+    """Join the prompt sections, memoized on the exact part strings.
+
+    The inputs are themselves cache hits on warm paths (str hashes are
+    computed once and stored on the object), so a repeat composition is a
+    tuple hash plus a dict lookup. Date/time goes first after the base
+    prompt - most important for temporal reasoning.
+    """
+    return f"{base_prompt}\n\n{date_context}\n{prefs_section}{context_section}"
 
-## User Info and Preferences (from user_info_and_preferences.md)
 
-IMPORTANT: Use the `name` from frontmatter when addressing the user. Use the `communication_style` to adjust your personality.
+async def build_full_system_prompt_async(client_timezone: str | None = None) -> str:
+    """
+    Async variant of build_full_system_prompt that overlaps the file reads.
 
-{prefs_content}
-"""
+    The three source files (prompt.md, preferences, current context) are
+    independent, so warm their caches concurrently in worker threads - wall
+    clock becomes max(t1, t2, t3) instead of the sum, which matters on
+    high-latency filesystems like cloud-synced home directories - then
+    assemble the prompt from the warmed caches.
+    """
+    await asyncio.gather(
+        asyncio.to_thread(load_system_prompt),
+        asyncio.to_thread(_read_text_cached, USER_PREFERENCES_FILE),
+        asyncio.to_thread(_read_text_cached, CURRENT_CONTEXT_FILE),
+    )
+    return build_full_system_prompt(client_timezone)
 
-    # Add current context section
-    if current_context.strip():
-        full_prompt += f"""
 
-## Current Active Context (from current_context.md)
+class _SingleMessageStream:
+    """
+    Minimal async iterable yielding one prebuilt message dict.
 
-These are the topics/items the user is currently focused on. Reference these when relevant:
+    The SDK wants streaming input as an async iterable, but a full async
+    generator drags in generator-frame setup and __anext__/aclose machinery
+    per message for something that never awaits. This class satisfies the
+    protocol with one flag check.
+    """
 
-{current_context}
-"""
-    else:
-        full_prompt += """
+    __slots__ = ("_message", "_consumed")
 
-## Current Active Context
+    def __init__(self, message: Dict[str, Any]):
+        self._message = message
+        self._consumed = False
 
-No active context items. This may be a new user or a fresh start.
-"""
+    def __aiter__(self) -> "_SingleMessageStream":
+        return self
 
-    return full_prompt
+    async def __anext__(self) -> Dict[str, Any]:
+        if self._consumed:
+            raise StopAsyncIteration
+        self._consumed = True
+        return self._message
 
 
-async def create_user_message(text: str) -> AsyncGenerator[Dict[str, Any], None]:
+def create_user_message(text: str) -> _SingleMessageStream:
     """
     Create a streaming user message for Claude.
 
@@ -440,16 +757,16 @@ async def create_user_message(text: str) -> AsyncGenerator[Dict[str, Any], None]
     Args:
         text: The user's message text
 
-    Yields:
-        Message dictionary in Claude SDK streaming format
+    Returns:
+        A one-element async iterable in Claude SDK streaming format
     """
-    yield {
+    return _SingleMessageStream({
         "type": "user",
         "message": {
             "role": "user",
             "content": text
         }
-    }
+    })
 
 
 # Type alias for the permission callback
@@ -527,37 +844,34 @@ class DonnaAgent:
         """
         # Auto-allow tools configured for automatic permission
         if tool_name in AUTO_ALLOWED_TOOLS:
-            return PermissionResultAllow(behavior="allow")
+            return _ALLOW
         
         # If no callback provided, auto-allow everything
         if self._on_permission_request is None:
-            return PermissionResultAllow(behavior="allow")
-        
+            return _ALLOW
+
         # Create permission request and call the callback
         request = PermissionRequest(tool_name=tool_name, tool_input=tool_input)
-        
+
         # Call the callback - it should return True/False
         allowed = await self._on_permission_request(request)
-        
+
         if allowed:
-            return PermissionResultAllow(behavior="allow")
-        return PermissionResultDeny(behavior="deny", message="User declined the request")
+            return _ALLOW
+        return _DENY_DECLINED
     
     async def __aenter__(self) -> "DonnaAgent":
         """Enter the async context manager, initializing the Claude client."""
         # Build full system prompt with user preferences, current context, and date/time
-        full_prompt = build_full_system_prompt(client_timezone=self._client_timezone)
+        full_prompt = await build_full_system_prompt_async(client_timezone=self._client_timezone)
         
-        # Get the package directory path for cwd (where .claude/ skills live)
-        package_dir = str(Path(__file__).parent)
-
         options = ClaudeAgentOptions(
             system_prompt=full_prompt,
             model=self._model,
             allowed_tools=self._allowed_tools,
             can_use_tool=self._permission_handler,
             # Set cwd to donna_life_os/ so Donna loads skills from donna_life_os/.claude/
-            cwd=package_dir,
+            cwd=_PACKAGE_DIR_STR,
             # Load settings from project .claude/ directory
             setting_sources=["project"],
             # Extended thinking configuration
@@ -586,6 +900,7 @@ class DonnaAgent:
         if self._client:
             await self._client.__aexit__(exc_type, exc_val, exc_tb)
             self._client = None
+        self._logger.close()
     
     async def send_message(self, text: str) -> None:
         """
@@ -619,3 +934,20 @@ class DonnaAgent:
         async for message in self._client.receive_response():
             self._logger.log_message(message)
             yield message
+
+    async def drain(self) -> None:
+        """
+        Consume and discard the pending response.
+
+        For fire-and-forget prompts (e.g. the silent context update on exit)
+        where nothing displays the output - skips conversation logging and
+        the async-generator hop per message.
+
+        Raises:
+            RuntimeError: If called outside of async context manager
+        """
+        if self._client is None:
+            raise RuntimeError("DonnaAgent must be used as an async context manager")
+
+        async for _ in self._client.receive_response():
+            pass
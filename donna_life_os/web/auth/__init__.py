@@ -5,13 +5,14 @@ Google OAuth authentication for protecting the web interface.
 """
 
 from .config import AuthConfig, get_auth_config
-from .routes import router as auth_router
+from .routes import init_oauth, router as auth_router
 from .middleware import AuthMiddleware, get_current_user, require_auth
 
 __all__ = [
     "AuthConfig",
     "get_auth_config",
     "auth_router",
+    "init_oauth",
     "AuthMiddleware",
     "get_current_user",
     "require_auth",
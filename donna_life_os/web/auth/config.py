@@ -9,44 +9,51 @@ from dataclasses import dataclass
 from functools import lru_cache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuthConfig:
-    """Authentication configuration."""
-    
+    """Authentication configuration.
+
+    Frozen - the config is read once from the environment and shared
+    process-wide, so nothing should mutate it after construction.
+    """
+
     # Whether authentication is enabled
     enabled: bool
-    
+
     # Google OAuth credentials
     google_client_id: str
     google_client_secret: str
-    
+
     # Session configuration
     session_secret_key: str
     session_cookie_name: str = "donna_session"
     session_max_age: int = 60 * 60 * 24 * 7  # 7 days
-    
-    # Allowed email domains (empty list = allow all)
-    allowed_email_domains: list[str] | None = None
 
-    # Exact email match (takes priority over domains)
+    # Allowed email domains, pre-lowercased (None = allow all)
+    allowed_email_domains: frozenset[str] | None = None
+
+    # Exact email match, pre-lowercased (takes priority over domains)
     allowed_email: str | None = None
     
     # Base URL for OAuth callbacks (e.g., "https://myapp.com")
     # If not set, will be inferred from request
     base_url: str | None = None
-    
+
+    # Whether the session cookie requires HTTPS
+    https_only: bool = False
+
+
     def is_email_allowed(self, email: str) -> bool:
         """Check if an email address is allowed to access the app."""
-        # Exact email match takes priority
+        # Exact email match takes priority (both sides pre-lowercased)
         if self.allowed_email:
-            return email.lower() == self.allowed_email.lower()
+            return email.lower() == self.allowed_email
 
         # Fall back to domain check
         if not self.allowed_email_domains:
             return True
 
-        domain = email.split("@")[-1].lower()
-        return domain in [d.lower() for d in self.allowed_email_domains]
+        return email.split("@")[-1].lower() in self.allowed_email_domains
 
 
 @lru_cache()
@@ -65,18 +72,22 @@ def get_auth_config() -> AuthConfig:
     - ALLOWED_EMAIL_DOMAINS: Comma-separated list of allowed email domains
     - AUTH_BASE_URL: Base URL for OAuth callbacks
     - SESSION_MAX_AGE: Session duration in seconds (default: 604800 = 7 days)
+    - AUTH_HTTPS_ONLY: Set to "true" to mark the session cookie Secure
     """
     enabled = os.getenv("AUTH_ENABLED", "false").lower() == "true"
     
-    # Parse allowed domains
+    # Parse allowed domains (normalized once so is_email_allowed compares
+    # against a prebuilt lowercase set)
     domains_str = os.getenv("ALLOWED_EMAIL_DOMAINS", "")
-    allowed_domains = [d.strip() for d in domains_str.split(",") if d.strip()] or None
-    
+    allowed_domains = frozenset(
+        d.strip().lower() for d in domains_str.split(",") if d.strip()
+    ) or None
+
     # Session max age
     session_max_age = int(os.getenv("SESSION_MAX_AGE", str(60 * 60 * 24 * 7)))
-    
+
     # Parse allowed email
-    allowed_email = os.getenv("ALLOWED_EMAIL", "").strip() or None
+    allowed_email = os.getenv("ALLOWED_EMAIL", "").strip().lower() or None
 
     return AuthConfig(
         enabled=enabled,
@@ -87,6 +98,7 @@ def get_auth_config() -> AuthConfig:
         allowed_email=allowed_email,
         base_url=os.getenv("AUTH_BASE_URL"),
         session_max_age=session_max_age,
+        https_only=os.getenv("AUTH_HTTPS_ONLY", "false").lower() == "true",
     )
 
 
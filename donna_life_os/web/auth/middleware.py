@@ -4,23 +4,23 @@ Authentication middleware.
 Protects API routes and WebSocket endpoints from unauthenticated access.
 """
 
-from typing import Callable, Any
+from typing import Any
 
 from fastapi import Request, WebSocket, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response, JSONResponse
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .config import get_auth_config
 
 
 # Routes that don't require authentication
-PUBLIC_ROUTES = {
+PUBLIC_ROUTES = frozenset({
     "/api/auth/login/google",
     "/api/auth/callback/google",
     "/api/auth/status",
     "/api/auth/logout",
     "/api/health",
-}
+})
 
 # Route prefixes that don't require authentication
 PUBLIC_PREFIXES = (
@@ -28,68 +28,78 @@ PUBLIC_PREFIXES = (
     "/donna-icon.svg",
 )
 
+# Stand-in user returned when auth is disabled (local/dev mode)
+_MOCK_USER = {
+    "email": "local@localhost",
+    "name": "Local User",
+    "picture": "",
+}
+
+
+def _is_public_route(path: str) -> bool:
+    """Check if a route is explicitly public."""
+    # startswith accepts the prefix tuple natively and compares in C
+    return path in PUBLIC_ROUTES or path.startswith(PUBLIC_PREFIXES)
+
+
+def _requires_auth(path: str) -> bool:
+    """Check if a route requires authentication."""
+    # API routes require auth
+    if path.startswith("/api/"):
+        return True
+
+    # WebSocket routes are handled separately
+    # (middleware doesn't intercept WebSocket upgrades the same way)
 
-class AuthMiddleware(BaseHTTPMiddleware):
+    return False
+
+
+class AuthMiddleware:
     """
     Middleware that enforces authentication on protected routes.
-    
+
     - API routes (/api/*) require authentication (except auth routes)
     - WebSocket routes (/ws/*) require authentication
     - Static files and SPA routes are allowed through
+
+    Implemented as a pure ASGI callable: Starlette's BaseHTTPMiddleware wraps
+    every request in an anyio task group plus a memory-stream pair, which is
+    real per-request overhead for what amounts to a couple of dict lookups.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        config = get_auth_config()
-        
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Snapshot at construction - auth config comes from env vars and
+        # doesn't change while the app is running, so an attribute read
+        # replaces a function call per request
+        self._enabled = get_auth_config().enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # If auth is disabled, allow everything
-        if not config.enabled:
-            return await call_next(request)
-        
-        path = request.url.path
-        
-        # Check if route is public
-        if self._is_public_route(path):
-            return await call_next(request)
-        
-        # Check if route requires auth
-        if self._requires_auth(path):
-            user = request.session.get("user")
-            
-            if not user:
-                # Return 401 for API routes
-                if path.startswith("/api/"):
-                    return JSONResponse(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        content={"detail": "Not authenticated"},
-                    )
-                
-                # For other routes, could redirect to login
-                # But we'll let the SPA handle it
-                pass
-        
-        return await call_next(request)
-    
-    def _is_public_route(self, path: str) -> bool:
-        """Check if a route is explicitly public."""
-        if path in PUBLIC_ROUTES:
-            return True
-        
-        for prefix in PUBLIC_PREFIXES:
-            if path.startswith(prefix):
-                return True
-        
-        return False
-    
-    def _requires_auth(self, path: str) -> bool:
-        """Check if a route requires authentication."""
-        # API routes require auth
-        if path.startswith("/api/"):
-            return True
-        
-        # WebSocket routes are handled separately
-        # (middleware doesn't intercept WebSocket upgrades the same way)
-        
-        return False
+        if not self._enabled:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
+        # Public routes pass straight through; protected API routes need a
+        # session user. Unauthenticated non-API routes fall through so the
+        # SPA can handle login itself.
+        if not _is_public_route(path) and _requires_auth(path):
+            user = scope.get("session", {}).get("user")
+            if not user and path.startswith("/api/"):
+                response = JSONResponse(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    content={"detail": "Not authenticated"},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
 
 
 async def get_current_user(request: Request) -> dict[str, Any] | None:
@@ -102,12 +112,8 @@ async def get_current_user(request: Request) -> dict[str, Any] | None:
     
     if not config.enabled:
         # Return a mock user when auth is disabled
-        return {
-            "email": "local@localhost",
-            "name": "Local User",
-            "picture": "",
-        }
-    
+        return _MOCK_USER
+
     return request.session.get("user")
 
 
@@ -139,12 +145,8 @@ async def verify_websocket_auth(websocket: WebSocket) -> dict[str, Any] | None:
     config = get_auth_config()
     
     if not config.enabled:
-        return {
-            "email": "local@localhost",
-            "name": "Local User",
-            "picture": "",
-        }
-    
+        return _MOCK_USER
+
     # Access the session from the WebSocket's scope
     # The session middleware should have populated this
     session = websocket.scope.get("session", {})
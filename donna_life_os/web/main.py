@@ -4,17 +4,29 @@ Donna Life OS - Web Portal
 FastAPI application serving the web interface for Donna.
 """
 
-import os
+import hashlib
 from pathlib import Path
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from .routes import chat, notes, files
-from .auth import auth_router, AuthMiddleware, get_auth_config
+from .auth import auth_router, AuthMiddleware, get_auth_config, init_oauth
+
+# Use uvloop for the web process when available (it ships with
+# uvicorn[standard] on non-Windows platforms). Everything hot here is
+# asyncio-bound - agent streaming, WebSockets, permission futures - and
+# uvloop's C event loop has 2-4x lower per-task overhead than stock asyncio.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 
 # Create FastAPI app
@@ -27,6 +39,13 @@ app = FastAPI(
 # Get auth configuration
 auth_config = get_auth_config()
 
+
+@app.on_event("startup")
+async def _init_oauth_client():
+    """Build the OAuth client (and prefetch discovery metadata) at startup."""
+    if auth_config.enabled:
+        init_oauth()
+
 # Auth middleware (checks authentication on protected routes)
 # Added first so it runs AFTER session middleware in the request flow
 app.add_middleware(AuthMiddleware)
@@ -34,13 +53,15 @@ app.add_middleware(AuthMiddleware)
 # Session middleware (required for OAuth)
 # Added after auth middleware so it runs BEFORE auth in the request flow
 # (Starlette middleware order: last added = first to process request)
+# Note: the cookie path stays "/" - scoping it to /api would stop the
+# browser from sending it on /ws/chat, which authenticates off the session
 app.add_middleware(
     SessionMiddleware,
     secret_key=auth_config.session_secret_key,
     session_cookie=auth_config.session_cookie_name,
     max_age=auth_config.session_max_age,
     same_site="lax",  # Protects against CSRF while allowing OAuth redirects
-    https_only=os.getenv("AUTH_HTTPS_ONLY", "false").lower() == "true",
+    https_only=auth_config.https_only,
 )
 
 # CORS middleware for development
@@ -56,14 +77,22 @@ cors_origins = [
 if auth_config.base_url:
     cors_origins.append(auth_config.base_url)
 
+# The API only uses GET/PUT (plus preflighted OPTIONS); enumerating them
+# lets browsers cache one preflight per route for a day instead of
+# re-asking before every cross-origin request from the dev server
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
+# Compress larger text responses (API JSON, index.html); hashed assets are
+# mostly compressed formats already, so a 1KB floor avoids wasted work
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(auth_router)  # Auth routes first
 app.include_router(notes.router)
@@ -72,35 +101,71 @@ app.include_router(files.router)
 
 
 # Health check endpoint (public, no auth required)
+# The payload is constant for the process lifetime, so serialize it once
+_HEALTH_RESPONSE = orjson.dumps({
+    "status": "healthy",
+    "service": "donna-web",
+    "auth_enabled": auth_config.enabled,
+})
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "donna-web",
-        "auth_enabled": auth_config.enabled,
-    }
+    return Response(content=_HEALTH_RESPONSE, media_type="application/json")
 
 
 # Serve static files in production
 # The frontend will be built to web/dist/
 STATIC_DIR = Path(__file__).parent.parent.parent / "web" / "dist"
 
+
+class HashedStaticFiles(StaticFiles):
+    """StaticFiles that marks responses as immutable.
+
+    Vite emits content-hashed filenames under /assets, so a changed file
+    always gets a new URL - returning clients can cache forever instead of
+    revalidating with conditional requests on every page load.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 if STATIC_DIR.exists():
     # Serve static assets
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
-    
+    app.mount("/assets", HashedStaticFiles(directory=STATIC_DIR / "assets"), name="assets")
+
+    # index.html is small and only changes when the frontend is rebuilt
+    # (which restarts or redeploys the server), so read it once instead of
+    # stat-ing and re-opening it on every SPA route hit. The content hash
+    # doubles as an ETag so returning clients get 304s.
+    _index_path = STATIC_DIR / "index.html"
+    _index_html: bytes | None = (
+        _index_path.read_bytes() if _index_path.exists() else None
+    )
+    _index_etag: str | None = (
+        f'"{hashlib.md5(_index_html).hexdigest()}"' if _index_html is not None else None
+    )
+
     # Catch-all route for SPA - serve index.html for any non-API route
     @app.get("/{path:path}")
-    async def serve_spa(path: str):
+    async def serve_spa(path: str, request: Request):
         """Serve the SPA for any non-API route."""
         # Don't intercept API or WebSocket routes
         if path.startswith("api/") or path.startswith("ws/"):
             return {"error": "Not found"}
-        
-        index_path = STATIC_DIR / "index.html"
-        if index_path.exists():
-            return FileResponse(index_path)
+
+        if _index_html is not None:
+            if request.headers.get("if-none-match") == _index_etag:
+                return Response(status_code=304, headers={"ETag": _index_etag})
+            return Response(
+                content=_index_html,
+                media_type="text/html",
+                headers={"ETag": _index_etag},
+            )
         return {"error": "Frontend not built. Run 'npm run build' in web/"}
 
 
@@ -113,4 +178,9 @@ if __name__ == "__main__":
         port=8000,
         reload=True,
         reload_dirs=["donna_life_os"],
+        # uvicorn[standard] ships all three: C event loop, C HTTP parser,
+        # and the C-accelerated websockets frames the chat stream rides on
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
     )
@@ -5,30 +5,70 @@ Handles real-time communication with the Donna agent.
 """
 
 import asyncio
-import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-logger = logging.getLogger(__name__)
-
-from claude_agent_sdk import (
-    AssistantMessage,
-    UserMessage,
-    TextBlock,
-    ToolUseBlock,
-    ToolResultBlock,
-    ResultMessage,
-)
-
-from donna_life_os.core import DonnaAgent, PermissionRequest
 from donna_life_os.web.auth.middleware import verify_websocket_auth
 from donna_life_os.web.auth.config import get_auth_config
 
+if TYPE_CHECKING:
+    from donna_life_os.core import DonnaAgent, PermissionRequest
+
+logger = logging.getLogger(__name__)
+
 
 router = APIRouter(tags=["chat"])
 
+# Auth config is an env snapshot that never changes while the process runs;
+# bind the flag once (same pattern as the auth middleware's snapshot)
+_AUTH_ENABLED = get_auth_config().enabled
+
+# The Claude Agent SDK (pulled in via donna_life_os.core) is by far the
+# heaviest import in the web process and is only needed once a chat socket
+# actually connects. Loading it lazily keeps app startup - and every
+# --reload cycle in development - fast for plain HTTP traffic.
+_agent_imports_loaded = False
+
+
+def _load_agent_imports() -> None:
+    """Import the agent stack on the first WebSocket connection."""
+    global _agent_imports_loaded
+    global AssistantMessage, UserMessage, TextBlock, ToolUseBlock
+    global ToolResultBlock, ResultMessage, DonnaAgent, _is_thinking_block
+
+    if _agent_imports_loaded:
+        return
+
+    from claude_agent_sdk import (
+        AssistantMessage,
+        UserMessage,
+        TextBlock,
+        ToolUseBlock,
+        ToolResultBlock,
+        ResultMessage,
+    )
+
+    try:
+        from claude_agent_sdk import ThinkingBlock
+    except ImportError:  # SDK versions that predate ThinkingBlock
+        ThinkingBlock = None
+
+    if ThinkingBlock is not None:
+        def _is_thinking_block(block) -> bool:
+            """Type check - cheaper than probing attributes on every block."""
+            return isinstance(block, ThinkingBlock)
+    else:
+        def _is_thinking_block(block) -> bool:
+            """Fallback duck-typing probe for SDKs without ThinkingBlock."""
+            return getattr(block, "thinking", None) is not None
+
+    from donna_life_os.core import DonnaAgent
+
+    _agent_imports_loaded = True
+
 
 class WebSocketPermissionHandler:
     """
@@ -42,55 +82,68 @@ class WebSocketPermissionHandler:
         self.websocket = websocket
         self._pending_permission: asyncio.Future | None = None
     
-    async def handle_permission(self, request: PermissionRequest) -> bool:
+    async def handle_permission(self, request: "PermissionRequest") -> bool:
         """
-        Send permission request to client and wait for response.
+        Send permission request to client and wait for the response.
 
-        IMPORTANT: This method receives WebSocket messages directly because
-        the main message loop is blocked waiting for process_agent_response()
-        to complete. We can't rely on resolve_permission() being called from
-        the main loop.
+        The connection's reader task owns receive_json() and resolves the
+        pending Future when a permission_response frame arrives, so regular
+        messages that come in while we wait are queued instead of dropped.
         """
-        # Send permission request
-        await self.websocket.send_json({
-            "type": "permission_request",
-            "tool": request.tool_name,
-            "input": request.tool_input,
-        })
-
+        # Create the future before the send await - a response arriving
+        # while the send is still in flight must find it pending, or the
+        # reader would drop it and we'd wait out the full timeout
+        self._pending_permission = asyncio.get_running_loop().create_future()
         try:
-            # Wait for permission response directly from WebSocket
-            # The main loop is blocked, so we must receive here
-            while True:
-                data = await asyncio.wait_for(
-                    self.websocket.receive_json(),
-                    timeout=300
-                )
-
-                if data.get("type") == "permission_response":
-                    return data.get("allowed", False)
-                # Ignore other message types while waiting for permission
+            await _send_payload(self.websocket, {
+                "type": "permission_request",
+                "tool": request.tool_name,
+                "input": request.tool_input,
+            })
+            return await asyncio.wait_for(self._pending_permission, timeout=300)
         except asyncio.TimeoutError:
             return False
+        finally:
+            self._pending_permission = None
 
     def resolve_permission(self, allowed: bool) -> None:
-        """
-        Resolve a pending permission request.
+        """Resolve a pending permission request (called by the reader task)."""
+        if self._pending_permission and not self._pending_permission.done():
+            self._pending_permission.set_result(allowed)
 
-        NOTE: This method is kept for API compatibility but is no longer
-        used since handle_permission() now receives messages directly.
+    def abort_pending(self) -> None:
+        """Deny an in-flight permission request; called when the client is gone.
+
+        Without this a disconnect mid-prompt would leave handle_permission
+        waiting out its full timeout against a dead socket, stalling agent
+        teardown.
         """
         if self._pending_permission and not self._pending_permission.done():
-            self._pending_permission.set_result(allowed)
+            self._pending_permission.set_result(False)
 
 
-async def send_message_event(websocket: WebSocket, event_type: str, data: Any) -> None:
-    """Send a typed event to the WebSocket client."""
-    await websocket.send_json({"type": event_type, **data})
+async def _send_payload(websocket: WebSocket, payload: dict) -> None:
+    """Serialize with orjson and send as a text frame.
+
+    orjson serializes several times faster than the stdlib encoder; the
+    decode keeps frames textual so the browser client's JSON.parse path
+    is unchanged.
+    """
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+async def send_message_event(websocket: WebSocket, event_type: str, data: dict) -> None:
+    """Send a typed event to the WebSocket client.
+
+    Tags the payload in place rather than building a merged copy; every
+    caller passes a freshly-built dict, so mutation is safe.
+    """
+    data["type"] = event_type
+    await _send_payload(websocket, data)
 
 
 async def process_agent_response(
-    donna: DonnaAgent,
+    donna: "DonnaAgent",
     websocket: WebSocket,
     dev_mode: bool = True,
 ) -> dict | None:
@@ -108,70 +161,150 @@ async def process_agent_response(
     result_stats = None
     message_count = 0
 
-    logger.info("[CHAT] Starting to receive response from agent")
-    async for message in donna.receive_response():
-        message_count += 1
-        logger.info(f"[CHAT] Received message {message_count}: {type(message).__name__}")
-        if isinstance(message, AssistantMessage):
-            parent_id = getattr(message, "parent_tool_use_id", None)
-            for block in message.content:
-                # Handle thinking/reasoning blocks
-                if hasattr(block, "thinking") and block.thinking:
-                    if dev_mode:
-                        await send_message_event(websocket, "thinking", {
-                            "content": block.thinking
-                        })
-
-                # Handle tool use blocks
-                elif isinstance(block, ToolUseBlock):
-                    if dev_mode:
-                        await send_message_event(websocket, "tool_use", {
-                            "name": block.name,
-                            "input": block.input,
-                            "toolId": block.id,
-                            "parentToolUseId": parent_id,
-                        })
-
-                # Handle text blocks (the actual response)
-                elif isinstance(block, TextBlock):
-                    # Filter empty text and SDK artifact "(no content)" placeholder
-                    if block.text and block.text.strip() and block.text.strip() != "(no content)":
-                        await send_message_event(websocket, "text", {
-                            "content": block.text
-                        })
-
-        # Handle tool results from UserMessage
-        elif isinstance(message, UserMessage):
-            parent_id = getattr(message, "parent_tool_use_id", None)
-            for block in message.content:
-                if isinstance(block, ToolResultBlock):
-                    if dev_mode:
-                        content = block.content
-                        if isinstance(content, list):
-                            texts = []
-                            for item in content:
-                                if isinstance(item, dict) and "text" in item:
-                                    texts.append(item["text"])
-                                else:
-                                    texts.append(str(item))
-                            content = "\n".join(texts)
-
-                        await send_message_event(websocket, "tool_result", {
-                            "content": str(content) if content else "",
-                            "isError": getattr(block, "is_error", False),
-                            "toolUseId": getattr(block, "tool_use_id", None),
-                            "parentToolUseId": parent_id,
-                        })
-        
-        # Capture result message for summary
-        elif isinstance(message, ResultMessage):
-            result_stats = {
-                "turns": message.num_turns,
-                "duration_ms": message.duration_ms,
-                "cost_usd": message.total_cost_usd,
-            }
-    
-    logger.info(f"[CHAT] Finished receiving response, total messages: {message_count}")
+    # Bounded producer/consumer pipeline: the producer drains the agent
+    # stream into ready-to-send payloads while the consumer owns the socket
+    # writes, so a slow client never stalls reads from the subprocess pipe.
+    # The bound applies backpressure instead of buffering without limit.
+    event_queue: asyncio.Queue[dict | object] = asyncio.Queue(maxsize=256)
+    stream_done = object()
+
+    async def _produce() -> None:
+        nonlocal result_stats, message_count
+        try:
+            async for message in donna.receive_response():
+                message_count += 1
+                logger.debug("[CHAT] Received message %d: %s", message_count, type(message).__name__)
+                if isinstance(message, AssistantMessage):
+                    # Outside dev mode only text reaches the client, so skip
+                    # the thinking/tool branches (and their per-block checks)
+                    # entirely on that path
+                    if not dev_mode:
+                        for block in message.content:
+                            if isinstance(block, TextBlock):
+                                # Filter empty text and SDK artifact "(no content)" placeholder
+                                if block.text and block.text.strip() and block.text.strip() != "(no content)":
+                                    await event_queue.put({
+                                        "type": "text",
+                                        "content": block.text,
+                                    })
+                        continue
+
+                    parent_id = getattr(message, "parent_tool_use_id", None)
+                    for block in message.content:
+                        # Handle thinking/reasoning blocks
+                        if _is_thinking_block(block) and block.thinking:
+                            await event_queue.put({
+                                "type": "thinking",
+                                "content": block.thinking,
+                            })
+
+                        # Handle tool use blocks
+                        elif isinstance(block, ToolUseBlock):
+                            await event_queue.put({
+                                "type": "tool_use",
+                                "name": block.name,
+                                "input": block.input,
+                                "toolId": block.id,
+                                "parentToolUseId": parent_id,
+                            })
+
+                        # Handle text blocks (the actual response)
+                        elif isinstance(block, TextBlock):
+                            # Filter empty text and SDK artifact "(no content)" placeholder
+                            if block.text and block.text.strip() and block.text.strip() != "(no content)":
+                                await event_queue.put({
+                                    "type": "text",
+                                    "content": block.text,
+                                })
+
+                # Handle tool results from UserMessage (dev mode only)
+                elif dev_mode and isinstance(message, UserMessage):
+                    parent_id = getattr(message, "parent_tool_use_id", None)
+                    for block in message.content:
+                        if isinstance(block, ToolResultBlock):
+                            content = block.content
+                            if isinstance(content, list):
+                                # join() consumes the generator directly;
+                                # no intermediate list of parts
+                                content = "\n".join(
+                                    item["text"]
+                                    if isinstance(item, dict) and "text" in item
+                                    else str(item)
+                                    for item in content
+                                )
+
+                            await event_queue.put({
+                                "type": "tool_result",
+                                "content": str(content) if content else "",
+                                "isError": getattr(block, "is_error", False),
+                                "toolUseId": getattr(block, "tool_use_id", None),
+                                "parentToolUseId": parent_id,
+                            })
+
+                # Capture result message for summary
+                elif isinstance(message, ResultMessage):
+                    result_stats = {
+                        "turns": message.num_turns,
+                        "duration_ms": message.duration_ms,
+                        "cost_usd": message.total_cost_usd,
+                    }
+        finally:
+            # put_nowait, not put: when the consumer dies with the bounded
+            # queue full, the cancellation from the outer finally lands on
+            # the body's blocked put - an awaited put here would then block
+            # forever with nothing draining and no second cancel coming. A
+            # full queue means the consumer is gone, so the sentinel is
+            # moot anyway.
+            try:
+                event_queue.put_nowait(stream_done)
+            except asyncio.QueueFull:
+                pass
+
+    async def _consume() -> None:
+        # Text coalescing happens here: after the first text payload, a
+        # short sleep lets a burst of deltas accumulate, then adjacent text
+        # payloads are merged into one frame. One frame every ~15ms is
+        # still far faster than anyone reads.
+        while True:
+            event = await event_queue.get()
+            if event is stream_done:
+                return
+            if event["type"] != "text":
+                await _send_payload(websocket, event)
+                continue
+
+            parts = [event["content"]]
+            await asyncio.sleep(0.015)  # coalescing window
+            deferred = None
+            while True:
+                try:
+                    queued = event_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if queued is stream_done or queued["type"] != "text":
+                    deferred = queued
+                    break
+                parts.append(queued["content"])
+
+            await _send_payload(websocket, {"type": "text", "content": "".join(parts)})
+            if deferred is stream_done:
+                return
+            if deferred is not None:
+                await _send_payload(websocket, deferred)
+
+    logger.debug("[CHAT] Starting to receive response from agent")
+    producer = asyncio.create_task(_produce())
+    consumer = asyncio.create_task(_consume())
+    try:
+        # gather propagates the first failure (agent error or client
+        # disconnect); the finally cancels whichever side is still running
+        # so a dead consumer can't leave the producer blocked on a full queue
+        await asyncio.gather(producer, consumer)
+    finally:
+        producer.cancel()
+        consumer.cancel()
+
+    logger.debug("[CHAT] Finished receiving response, total messages: %d", message_count)
     return result_stats
 
 
@@ -195,8 +328,7 @@ async def chat_websocket(websocket: WebSocket):
     - Server sends: {"type": "error", "message": "..."}
     """
     # Check authentication before accepting the connection
-    auth_config = get_auth_config()
-    if auth_config.enabled:
+    if _AUTH_ENABLED:
         user = await verify_websocket_auth(websocket)
         if not user:
             # Accept then close to avoid noisy 403 logs
@@ -209,10 +341,47 @@ async def chat_websocket(websocket: WebSocket):
 
     await websocket.accept()
 
+    # First connection pays the import cost; subsequent ones are a no-op
+    _load_agent_imports()
+
     permission_handler = WebSocketPermissionHandler(websocket)
-    donna: DonnaAgent | None = None
+    donna: "DonnaAgent | None" = None
     dev_mode = True
 
+    # A single reader task demultiplexes inbound frames: permission replies
+    # resolve the handler's Future immediately, everything else is queued for
+    # the main loop. Exactly one coroutine calls receive_json(), so permission
+    # prompts no longer swallow regular messages that arrive mid-turn.
+    message_queue: asyncio.Queue[dict | None] = asyncio.Queue()
+
+    async def _read_frames() -> None:
+        try:
+            while True:
+                try:
+                    data = orjson.loads(await websocket.receive_text())
+                except orjson.JSONDecodeError:
+                    await send_message_event(websocket, "error", {
+                        "message": "Invalid JSON"
+                    })
+                    continue
+
+                if data.get("type") == "permission_response":
+                    permission_handler.resolve_permission(data.get("allowed", False))
+                else:
+                    await message_queue.put(data)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            # Runs on disconnect, unexpected reader errors (e.g. the error
+            # send above failing on a closing socket), and cancellation:
+            # deny any in-flight permission prompt so handle_permission
+            # isn't left waiting out its timeout, and always deliver the
+            # sentinel so the main loop's queue.get() can't hang forever
+            permission_handler.abort_pending()
+            message_queue.put_nowait(None)
+
+    reader_task = asyncio.create_task(_read_frames())
+
     try:
         # Initialize the agent with client timezone
         donna = DonnaAgent(
@@ -225,23 +394,19 @@ async def chat_websocket(websocket: WebSocket):
         logger.info("[CHAT] Sending greeting_start, processing greeting response")
         await send_message_event(websocket, "greeting_start", {})
         stats = await process_agent_response(donna, websocket, dev_mode)
-        logger.info(f"[CHAT] Greeting completed, stats: {stats}")
+        logger.info("[CHAT] Greeting completed, stats: %s", stats)
         if stats:
             await send_message_event(websocket, "session_end", {"stats": stats})
 
         logger.info("[CHAT] Entering main message loop")
-        # Main message loop
+        # Main message loop - frames arrive via the reader task's queue
         while True:
-            try:
-                data = await websocket.receive_json()
-            except json.JSONDecodeError:
-                await send_message_event(websocket, "error", {
-                    "message": "Invalid JSON"
-                })
-                continue
-            
+            data = await message_queue.get()
+            if data is None:
+                break  # client disconnected
+
             msg_type = data.get("type")
-            
+
             if msg_type == "message":
                 content = data.get("content", "").strip()
                 dev_mode = data.get("devMode", True)
@@ -250,30 +415,26 @@ async def chat_websocket(websocket: WebSocket):
                     continue
 
                 # Send user message to agent and process response
-                logger.info(f"[CHAT] Sending message to agent: {content[:50]}...")
+                logger.debug("[CHAT] Sending message to agent: %.50s...", content)
                 try:
                     await donna.send_message(content)
-                    logger.info("[CHAT] send_message completed successfully")
+                    logger.debug("[CHAT] send_message completed successfully")
 
                     # Process and stream response
-                    logger.info("[CHAT] Starting process_agent_response")
+                    logger.debug("[CHAT] Starting process_agent_response")
                     stats = await process_agent_response(donna, websocket, dev_mode)
-                    logger.info(f"[CHAT] process_agent_response completed, stats: {stats}")
+                    logger.debug("[CHAT] process_agent_response completed, stats: %s", stats)
 
                     if stats:
                         await send_message_event(websocket, "session_end", {"stats": stats})
                 except Exception as e:
-                    logger.error(f"[CHAT] Agent error during message handling: {e}")
+                    logger.error("[CHAT] Agent error during message handling: %s", e)
                     await send_message_event(websocket, "error", {
                         "message": f"Agent error: {e}"
                     })
                     # Agent subprocess likely died — break out so finally block cleans up
                     break
-            
-            elif msg_type == "permission_response":
-                allowed = data.get("allowed", False)
-                permission_handler.resolve_permission(allowed)
-            
+
             elif msg_type == "disconnect":
                 break
     
@@ -287,6 +448,7 @@ async def chat_websocket(websocket: WebSocket):
         except Exception:
             pass
     finally:
+        reader_task.cancel()
         if donna:
             try:
                 await donna.__aexit__(None, None, None)
@@ -5,31 +5,52 @@ Monitors ~/donna-data directory for changes and broadcasts to connected clients.
 """
 
 import asyncio
+import os
+import time
 from pathlib import Path
 from typing import Set
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
+from watchdog.events import PatternMatchingEventHandler, FileSystemEvent
 
 from donna_life_os.config import DONNA_DATA_DIR
 from donna_life_os.web.auth.middleware import verify_websocket_auth
 from donna_life_os.web.auth.config import get_auth_config
+from donna_life_os.web.utils.markdown import discard_note_meta, invalidate_stem_index
 
 
 router = APIRouter(tags=["files"])
 
 
-class FileChangeHandler(FileSystemEventHandler):
+class FileChangeHandler(PatternMatchingEventHandler):
     """
     Watchdog handler that queues file change events.
+
+    Filtering to markdown files, skipping hidden files, and dropping
+    directory events happen in watchdog's own dispatch via the pattern
+    arguments; hidden *directories* anywhere on the path are checked in
+    _queue_event, since fnmatch-style ignore_patterns only match the
+    final component.
     """
-    
+
+    # Events for the same (type, path) within this window are dropped -
+    # editors emit several inotify events per save
+    _DEBOUNCE_SECONDS = 0.05
+
     def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__(
+            patterns=["*.md"],
+            ignore_patterns=["*/.*"],
+            ignore_directories=True,
+            case_sensitive=False,
+        )
         self.loop = loop
         self.queue = queue
         self._base_dir = DONNA_DATA_DIR.resolve()
-    
+        self._last_emit: dict[tuple[str, str], float] = {}
+
     def _get_relative_path(self, path: str) -> str | None:
         """Get path relative to ~/donna-data, or None if outside."""
         try:
@@ -38,26 +59,41 @@ class FileChangeHandler(FileSystemEventHandler):
             return str(rel_path)
         except ValueError:
             return None
-    
-    def _should_ignore(self, path: str) -> bool:
-        """Check if this path should be ignored."""
-        # Ignore hidden files and directories
-        parts = Path(path).parts
-        return any(part.startswith(".") for part in parts)
-    
+
     def _queue_event(self, event_type: str, path: str) -> None:
         """Queue an event for async processing."""
-        if self._should_ignore(path):
-            return
-        
         rel_path = self._get_relative_path(path)
         if rel_path is None:
             return
-        
-        # Only track markdown files
-        if not path.endswith(".md"):
+
+        # Ignore files inside hidden directories (.obsidian, .trash, ...);
+        # the dispatch-level ignore_patterns only cover hidden basenames
+        if rel_path.startswith(".") or (os.sep + ".") in rel_path:
             return
-        
+
+        # Debounce repeats of the same event - drop anything inside the
+        # window, and prune stale entries so the dict stays bounded
+        key = (event_type, rel_path)
+        now = time.monotonic()
+        if now - self._last_emit.get(key, 0.0) < self._DEBOUNCE_SECONDS:
+            return
+        if len(self._last_emit) > 1024:
+            cutoff = now - 60.0
+            self._last_emit = {
+                k: ts for k, ts in self._last_emit.items() if ts > cutoff
+            }
+        self._last_emit[key] = now
+
+        # Creates, deletes, and moves change which stems exist, so drop the
+        # wiki-link index (just a pointer write; safe from this thread)
+        if event_type != "file_changed":
+            invalidate_stem_index()
+
+        # The parse cache validates by mtime, so only deletions need an
+        # explicit evict (a deleted file's entry would otherwise linger)
+        if event_type == "file_deleted":
+            discard_note_meta(path)
+
         try:
             self.loop.call_soon_threadsafe(
                 self.queue.put_nowait,
@@ -67,22 +103,22 @@ class FileChangeHandler(FileSystemEventHandler):
             pass
     
     def on_created(self, event: FileSystemEvent) -> None:
-        if not event.is_directory:
-            self._queue_event("file_created", event.src_path)
-    
+        self._queue_event("file_created", event.src_path)
+
     def on_modified(self, event: FileSystemEvent) -> None:
-        if not event.is_directory:
-            self._queue_event("file_changed", event.src_path)
-    
+        self._queue_event("file_changed", event.src_path)
+
     def on_deleted(self, event: FileSystemEvent) -> None:
-        if not event.is_directory:
-            self._queue_event("file_deleted", event.src_path)
-    
+        self._queue_event("file_deleted", event.src_path)
+
     def on_moved(self, event: FileSystemEvent) -> None:
-        if not event.is_directory:
+        # A move dispatches when either side matches *.md, so check each
+        # path individually (e.g. a note renamed away from .md)
+        if event.src_path.endswith(".md"):
             self._queue_event("file_deleted", event.src_path)
-            if hasattr(event, "dest_path"):
-                self._queue_event("file_created", event.dest_path)
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path and dest_path.endswith(".md"):
+            self._queue_event("file_created", dest_path)
 
 
 # Global set of connected WebSocket clients for file watching
@@ -99,24 +135,75 @@ async def _broadcast_events() -> None:
     while True:
         try:
             event = await _event_queue.get()
-            
-            # Broadcast to all connected clients
-            disconnected = set()
-            for client in _file_watch_clients:
+
+            # Editors save files via open/truncate/write/rename dances that
+            # emit bursts of events per keystroke of actual change. Wait a
+            # short window, drain whatever else arrived, and keep only the
+            # latest event per (type, path) so a save storm costs one
+            # broadcast per file instead of dozens. Keying on the type too
+            # matters: a new note arrives as create-then-modify, and the
+            # frontend only refreshes its tree on creates/deletes, so the
+            # create must survive the window. Survivors still go out as
+            # individual frames - the frontend protocol is one event per
+            # message.
+            latest = {(event["type"], event["path"]): event}
+            await asyncio.sleep(0.05)
+            while True:
                 try:
-                    await client.send_json(event)
-                except Exception:
-                    disconnected.add(client)
-            
-            # Remove disconnected clients
-            _file_watch_clients.difference_update(disconnected)
-            
+                    queued = _event_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                latest[(queued["type"], queued["path"])] = queued
+
+            for event in latest.values():
+                await _send_to_clients(event)
+
         except asyncio.CancelledError:
             break
         except Exception:
             pass
 
 
+# How many concurrent sends to pack into one scheduler tick. Batching keeps
+# a large fan-out from monopolizing the loop while still overlapping the
+# network waits within each batch.
+_BROADCAST_BATCH_SIZE = 50
+
+
+async def _send_to_clients(event: dict) -> None:
+    """Send one event to every connected client, dropping dead sockets."""
+    # Serialize once - send_json would re-encode the same dict per client.
+    # Sent as a text frame since the frontend JSON.parses message data.
+    payload = orjson.dumps(event).decode()
+
+    # Broadcast concurrently within each batch - awaiting each send in turn
+    # lets one client with a full TCP buffer stall everyone else. The
+    # per-send timeout bounds how long a stuck socket can hold up a
+    # broadcast before we drop it.
+    clients = list(_file_watch_clients)
+    disconnected = set()
+
+    for start in range(0, len(clients), _BROADCAST_BATCH_SIZE):
+        batch = clients[start:start + _BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(client.send_text(payload), timeout=5.0)
+                for client in batch
+            ),
+            return_exceptions=True,
+        )
+
+        # Collect disconnected (or timed-out) clients
+        for client, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                disconnected.add(client)
+
+        # Yield between batches so HTTP handlers and chat streams get a turn
+        await asyncio.sleep(0)
+
+    _file_watch_clients.difference_update(disconnected)
+
+
 def _start_file_watcher() -> None:
     """Start the file watcher if not already running."""
     global _observer, _event_queue, _broadcast_task
@@ -4,14 +4,15 @@ Notes REST API routes.
 Provides endpoints for listing and reading notes from ~/donna-data.
 """
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from ..utils.markdown import build_file_tree, parse_note, resolve_wiki_link, parse_frontmatter
+from ..utils.markdown import build_file_tree, get_note_meta, parse_note, resolve_wiki_link
 
 
 class NoteContent(BaseModel):
@@ -23,6 +24,51 @@ from donna_life_os.config import DONNA_DATA_DIR
 
 router = APIRouter(prefix="/api/notes", tags=["notes"])
 
+# resolve() stats every path component; the data root never moves while the
+# server runs, so resolve it once instead of on every request
+_DATA_ROOT = DONNA_DATA_DIR.resolve()
+
+
+def _safe_note_path(path: str) -> Path:
+    """
+    Resolve a relative note path, rejecting anything outside ~/donna-data.
+
+    Raises:
+        HTTPException: 403 if the path escapes the data dir or won't resolve
+    """
+    try:
+        note_path = (DONNA_DATA_DIR / path).resolve()
+    except (ValueError, OSError):
+        raise HTTPException(status_code=403, detail="Invalid path")
+
+    if not note_path.is_relative_to(_DATA_ROOT):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    return note_path
+
+
+def resolved_note_path(path: str) -> Path:
+    """
+    Dependency that validates and resolves the {path} parameter.
+
+    Ensures the .md suffix, containment within ~/donna-data, and that the
+    target exists and is a regular file. Declared as a plain def so FastAPI
+    runs it (and its stat calls) in the threadpool, off the event loop.
+    """
+    # Ensure .md extension
+    if not path.endswith(".md"):
+        path = f"{path}.md"
+
+    note_path = _safe_note_path(path)
+
+    if not note_path.exists():
+        raise HTTPException(status_code=404, detail=f"Note not found: {path}")
+
+    if not note_path.is_file():
+        raise HTTPException(status_code=400, detail="Path is not a file")
+
+    return note_path
+
 
 @router.get("")
 async def list_notes() -> dict[str, Any]:
@@ -40,7 +86,9 @@ async def list_notes() -> dict[str, Any]:
             "children": [],
         }
     
-    return build_file_tree(DONNA_DATA_DIR)
+    # The tree walk is blocking disk I/O; run it off the event loop so it
+    # doesn't stall WebSocket streams while a large vault is listed
+    return await asyncio.to_thread(build_file_tree, DONNA_DATA_DIR)
 
 
 @router.get("/recent")
@@ -66,41 +114,81 @@ async def list_recent_notes(
             "total": 0,
             "has_more": False,
         }
-    
-    # Collect all markdown files with their modification times
-    all_notes = []
-    for md_file in DONNA_DATA_DIR.rglob("*.md"):
-        # Skip hidden files
-        if any(part.startswith(".") for part in md_file.parts):
-            continue
 
-        # Skip template files
-        if md_file.name.endswith("_template.md"):
-            continue
+    # The scan stats and reads every note - run it off the event loop so a
+    # large vault doesn't block other requests and WebSocket broadcasts
+    all_notes = await asyncio.to_thread(_collect_recent_notes)
+
+    total = len(all_notes)
+    paginated = all_notes[offset:offset + limit]
+
+    return {
+        "notes": paginated,
+        "total": total,
+        "has_more": offset + limit < total,
+    }
+
+
+def _resolve_links(links: list[str]) -> dict[str, str]:
+    """
+    Resolve wiki links to file paths, dropping the unresolved ones (blocking).
+
+    Run via to_thread from the routes: resolutions are cache hits once the
+    stem index is warm, but a cold index triggers a full tree scan that
+    shouldn't run on the event loop.
+    """
+    resolved_links = {}
+    for link in links:
+        resolved = resolve_wiki_link(link, DONNA_DATA_DIR)
+        if resolved:
+            resolved_links[link] = resolved
+    return resolved_links
+
+
+def _walk_md(dir_path: str):
+    """
+    Yield os.DirEntry objects for markdown files under dir_path (blocking).
 
+    Skips hidden files/directories and template files. scandir is preferred
+    over rglob here: DirEntry carries stat information from the directory
+    read and no Path object is allocated per entry.
+    """
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_md(entry.path)
+            elif entry.name.endswith(".md") and not entry.name.endswith("_template.md"):
+                yield entry
+
+
+def _collect_recent_notes() -> list[dict[str, Any]]:
+    """Collect metadata for every note, sorted by modification time (blocking)."""
+    all_notes = []
+    prefix_len = len(str(DONNA_DATA_DIR)) + 1
+    for entry in _walk_md(str(DONNA_DATA_DIR)):
         try:
-            stat = md_file.stat()
-            rel_path = str(md_file.relative_to(DONNA_DATA_DIR))
-            
-            # Get parent folder name for context
-            parent = md_file.parent
-            folder = parent.name if parent != DONNA_DATA_DIR else None
-            
-            # Parse frontmatter for title and metadata
-            content = md_file.read_text()
-            frontmatter, body = parse_frontmatter(content)
-            
+            stat = entry.stat()
+            rel_path = entry.path[prefix_len:]
+            stem = entry.name[:-3]
+
+            # Get parent folder name for context (last directory component
+            # of the relative path; None for notes at the root)
+            folder = None
+            slash = rel_path.rfind(os.sep)
+            if slash != -1:
+                folder = rel_path[rel_path.rfind(os.sep, 0, slash) + 1:slash]
+
+            # Frontmatter and preview, cached until the file's mtime changes
+            _, frontmatter, preview = get_note_meta(entry.path, stat)
+
             # Get title from frontmatter or filename
-            title = frontmatter.get("title") or md_file.stem.replace("-", " ").title()
-            
-            # Get a preview (first 100 chars of content, stripped)
-            preview = body.strip()[:150].replace("\n", " ").strip()
-            if len(body.strip()) > 150:
-                preview += "..."
-            
+            title = frontmatter.get("title") or stem.replace("-", " ").title()
+
             all_notes.append({
                 "path": rel_path,
-                "name": md_file.stem,
+                "name": stem,
                 "title": title,
                 "folder": folder,
                 "preview": preview,
@@ -114,65 +202,35 @@ async def list_recent_notes(
     
     # Sort by modification time (most recent first)
     all_notes.sort(key=lambda x: x["modified_at"], reverse=True)
-    
-    total = len(all_notes)
-    paginated = all_notes[offset:offset + limit]
-    
-    return {
-        "notes": paginated,
-        "total": total,
-        "has_more": offset + limit < total,
-    }
+
+    return all_notes
 
 
 @router.get("/{path:path}")
-async def get_note(path: str) -> dict[str, Any]:
+async def get_note(note_path: Path = Depends(resolved_note_path)) -> dict[str, Any]:
     """
     Get a single note by path.
-    
+
     Args:
-        path: Relative path to the note (e.g., "tasks/order-crib.md")
-        
+        note_path: Validated absolute path, resolved from the {path} parameter
+
     Returns:
         Parsed note with frontmatter, content, and wiki links
     """
-    # Ensure .md extension
-    if not path.endswith(".md"):
-        path = f"{path}.md"
-    
-    note_path = DONNA_DATA_DIR / path
-    
-    # Security: ensure path is within ~/donna-data
-    try:
-        note_path = note_path.resolve()
-        DONNA_DATA_DIR.resolve()
-        if not str(note_path).startswith(str(DONNA_DATA_DIR.resolve())):
-            raise HTTPException(status_code=403, detail="Access denied")
-    except Exception:
-        raise HTTPException(status_code=403, detail="Invalid path")
-    
-    if not note_path.exists():
-        raise HTTPException(status_code=404, detail=f"Note not found: {path}")
-    
-    if not note_path.is_file():
-        raise HTTPException(status_code=400, detail="Path is not a file")
-    
+    # Read and parse off the event loop - read_text blocks on disk and the
+    # YAML frontmatter parse is CPU work
     try:
-        content = note_path.read_text()
+        content = await asyncio.to_thread(note_path.read_text)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading note: {e}")
-    
-    parsed = parse_note(content)
-    
+
+    parsed = await asyncio.to_thread(parse_note, content)
+
     # Resolve wiki links to actual paths
-    resolved_links = {}
-    for link in parsed.wiki_links:
-        resolved = resolve_wiki_link(link, DONNA_DATA_DIR)
-        if resolved:
-            resolved_links[link] = resolved
-    
+    resolved_links = await asyncio.to_thread(_resolve_links, parsed.wiki_links)
+
     return {
-        "path": path,
+        "path": str(note_path.relative_to(_DATA_ROOT)),
         "frontmatter": parsed.frontmatter,
         "content": parsed.content,
         "raw": parsed.raw,
@@ -182,55 +240,33 @@ async def get_note(path: str) -> dict[str, Any]:
 
 
 @router.put("/{path:path}")
-async def update_note(path: str, body: NoteContent) -> dict[str, Any]:
+async def update_note(
+    body: NoteContent, note_path: Path = Depends(resolved_note_path)
+) -> dict[str, Any]:
     """
     Update a note's content.
 
     Args:
-        path: Relative path to the note (e.g., "tasks/order-crib.md")
         body: Request body containing the new content
+        note_path: Validated absolute path, resolved from the {path} parameter
 
     Returns:
         Updated parsed note with frontmatter, content, and wiki links
     """
-    # Ensure .md extension
-    if not path.endswith(".md"):
-        path = f"{path}.md"
-
-    note_path = DONNA_DATA_DIR / path
-
-    # Security: ensure path is within ~/donna-data
-    try:
-        note_path = note_path.resolve()
-        if not str(note_path).startswith(str(DONNA_DATA_DIR.resolve())):
-            raise HTTPException(status_code=403, detail="Access denied")
-    except Exception:
-        raise HTTPException(status_code=403, detail="Invalid path")
-
-    if not note_path.exists():
-        raise HTTPException(status_code=404, detail=f"Note not found: {path}")
-
-    if not note_path.is_file():
-        raise HTTPException(status_code=400, detail="Path is not a file")
-
-    # Write the new content
+    # Write the new content (off the event loop - blocking disk I/O)
     try:
-        note_path.write_text(body.content)
+        await asyncio.to_thread(note_path.write_text, body.content)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error writing note: {e}")
 
     # Parse and return the updated note
-    parsed = parse_note(body.content)
+    parsed = await asyncio.to_thread(parse_note, body.content)
 
     # Resolve wiki links to actual paths
-    resolved_links = {}
-    for link in parsed.wiki_links:
-        resolved = resolve_wiki_link(link, DONNA_DATA_DIR)
-        if resolved:
-            resolved_links[link] = resolved
+    resolved_links = await asyncio.to_thread(_resolve_links, parsed.wiki_links)
 
     return {
-        "path": path,
+        "path": str(note_path.relative_to(_DATA_ROOT)),
         "frontmatter": parsed.frontmatter,
         "content": parsed.content,
         "raw": parsed.raw,
@@ -2,13 +2,22 @@
 Markdown utilities for parsing frontmatter and wiki links.
 """
 
+import os
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml C loader (~10x faster) when the bindings are compiled
+# in; yaml.safe_load always picks the pure-Python loader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class ParsedNote:
@@ -30,37 +39,53 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     Returns:
         Tuple of (frontmatter dict, content without frontmatter)
     """
-    if not content.startswith("---"):
+    # Locate the closing fence with find() and slice, rather than
+    # split("---", 2) which copies the whole document into substrings;
+    # only the (small) YAML chunk and the tail are materialized
+    if not content.startswith("---\n") and not content.startswith("---\r\n"):
         return {}, content
-    
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+
+    end = content.find("\n---", 3)
+    if end < 0:
         return {}, content
-    
-    try:
-        frontmatter = yaml.safe_load(parts[1]) or {}
-    except yaml.YAMLError:
+
+    chunk = content[3:end]
+    if not chunk.strip():
         frontmatter = {}
-    
-    # Content is everything after the second ---
-    body = parts[2].lstrip("\n")
-    
+    else:
+        try:
+            frontmatter = yaml.load(chunk, Loader=_YamlLoader) or {}
+        except yaml.YAMLError:
+            frontmatter = {}
+
+    # Content is everything after the closing ---
+    body = content[end + 4:].lstrip("\n")
+
     return frontmatter, body
 
 
+# Wiki-style [[link]] syntax, compiled once for the note-parse hot path
+_WIKI_LINK_RE = re.compile(r"\[\[([^\]]+)\]\]")
+
+
 def extract_wiki_links(content: str) -> list[str]:
     """
     Extract wiki-style links [[link]] from markdown content.
-    
+
     Args:
         content: Markdown content
-        
+
     Returns:
-        List of link targets (without brackets)
+        List of unique link targets (without brackets), in order of appearance
     """
-    pattern = r"\[\[([^\]]+)\]\]"
-    matches = re.findall(pattern, content)
-    return list(set(matches))  # Deduplicate
+    seen = set()
+    links = []
+    for match in _WIKI_LINK_RE.finditer(content):
+        target = match.group(1)
+        if target not in seen:
+            seen.add(target)
+            links.append(target)
+    return links
 
 
 def parse_note(content: str) -> ParsedNote:
@@ -84,104 +109,241 @@ def parse_note(content: str) -> ParsedNote:
     )
 
 
+# Per-file parse cache: {absolute path: (mtime, frontmatter, preview)}.
+# Every hit is validated against the file's current mtime, so a stale entry
+# can only waste memory, never serve stale data; the file watcher drops
+# entries for deleted files so the dict stays bounded by the live tree.
+_note_meta_cache: dict[str, tuple[float, dict[str, Any], str]] = {}
+
+_PREVIEW_LENGTH = 150
+
+# How much of a note the listings read. Frontmatter is typically well under
+# 1KB and the preview needs 150 chars, so 8KB covers both with plenty of
+# slack while keeping a 50KB note from costing 50KB of I/O per listing.
+_HEAD_BYTES = 8192
+
+
+def read_note_head(path: Path | str, nbytes: int = _HEAD_BYTES) -> str:
+    """Read up to nbytes from the start of a note, decoded as UTF-8."""
+    with open(path, "rb") as f:
+        # errors="replace" guards against truncating mid multi-byte char
+        return f.read(nbytes).decode("utf-8", errors="replace")
+
+
+def get_note_meta(
+    path: Path | str, st: os.stat_result | None = None
+) -> tuple[float, dict[str, Any], str]:
+    """
+    Get (mtime, frontmatter, preview) for a note, cached by mtime.
+
+    Args:
+        path: Path to the markdown file
+        st: Optional pre-fetched stat result, to avoid a second syscall
+
+    Returns:
+        Tuple of (st_mtime, frontmatter dict, body preview)
+    """
+    if st is None:
+        st = os.stat(path)
+
+    key = os.fspath(path)
+    cached = _note_meta_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime:
+        return cached
+
+    # The listings only need frontmatter and a short preview, so read a
+    # fixed-size head instead of the whole file
+    content = read_note_head(path)
+    truncated = st.st_size > _HEAD_BYTES
+    frontmatter, body = parse_frontmatter(content)
+
+    stripped = body.strip()
+    preview = stripped[:_PREVIEW_LENGTH].replace("\n", " ").strip()
+    if truncated or len(stripped) > _PREVIEW_LENGTH:
+        preview += "..."
+
+    entry = (st.st_mtime, frontmatter, preview)
+    _note_meta_cache[key] = entry
+    return entry
+
+
+def discard_note_meta(path: str) -> None:
+    """Drop a deleted file's cached metadata; called by the file watcher."""
+    _note_meta_cache.pop(path, None)
+
+
+# Cached {lowercased stem: relative path} index over the notes tree. Built
+# lazily on the first name-only link and reused until the file watcher
+# reports a create/delete/move; without it every wiki link in every note
+# read triggered a full rglob scan of the vault.
+_stem_index: dict[str, str] | None = None
+_stem_index_dir: Path | None = None
+_stem_index_built_at = 0.0
+
+# How long a lookup miss trusts the index before forcing a rebuild. The
+# file watcher invalidates eagerly when it's running, but it only runs
+# while a /ws/files client is connected; this TTL keeps misses fresh
+# without it (a new note becomes resolvable within seconds) while
+# rate-limiting rescans of the tree.
+_STEM_INDEX_TTL = 2.0
+
+
+def _build_stem_index(notes_dir: Path) -> dict[str, str]:
+    """Map each markdown file's lowercased stem to its relative path."""
+    index: dict[str, str] = {}
+    for md_file in notes_dir.rglob("*.md"):
+        # First match wins, same as the scan this index replaces
+        index.setdefault(md_file.stem.lower(), str(md_file.relative_to(notes_dir)))
+    return index
+
+
+def _rebuild_stem_index(notes_dir: Path) -> None:
+    """Rebuild the stem index for notes_dir and drop derived memo entries."""
+    global _stem_index, _stem_index_dir, _stem_index_built_at
+    _stem_index = _build_stem_index(notes_dir)
+    _stem_index_dir = notes_dir
+    _stem_index_built_at = time.monotonic()
+    # Memoized resolutions derive from the old index; clearing here also
+    # sheds positives for notes deleted since the last build
+    _resolve_memo.clear()
+
+
+# Memo of successful resolutions only. Negative results are never stored:
+# the file watcher that invalidates these caches only runs while a
+# /ws/files client is connected, and a memoized None would otherwise leave
+# a link dead for the process lifetime once its note finally appears.
+_resolve_memo: dict[tuple[str, str], str] = {}
+_RESOLVE_MEMO_MAX = 8192
+
+
+def invalidate_stem_index() -> None:
+    """Drop the stem index; called when the notes tree changes on disk."""
+    global _stem_index
+    _stem_index = None
+    _resolve_memo.clear()
+
+
 def resolve_wiki_link(link: str, notes_dir: Path) -> str | None:
     """
     Resolve a wiki link to a file path.
-    
+
     Wiki links can be:
     - Simple names: [[Baby Prep]] -> baby-prep.md (searches all dirs)
     - With path: [[tasks/order-crib]] -> tasks/order-crib.md
-    
+
     Args:
         link: The wiki link text (without brackets)
         notes_dir: Base directory for notes (~/donna-data)
-        
+
     Returns:
         Relative path to the file, or None if not found
     """
     # Normalize the link: lowercase, replace spaces with hyphens
     normalized = link.lower().replace(" ", "-")
-    
+    return _resolve_cached(normalized, str(notes_dir))
+
+
+def _resolve_cached(normalized: str, notes_dir_str: str) -> str | None:
+    """
+    Resolve a normalized wiki link, memoizing successful lookups.
+
+    The memo also covers the exists() stat for path-style links; it is
+    cleared alongside the stem index whenever the tree changes, and misses
+    always re-consult the index so new notes become resolvable.
+    """
+    key = (normalized, notes_dir_str)
+    cached = _resolve_memo.get(key)
+    if cached is not None:
+        return cached
+
+    notes_dir = Path(notes_dir_str)
+
     # If it contains a path separator, try direct match
     if "/" in normalized:
         target = notes_dir / f"{normalized}.md"
         if target.exists():
-            return str(target.relative_to(notes_dir))
-    
-    # Search all directories for a matching file
-    for md_file in notes_dir.rglob("*.md"):
-        stem = md_file.stem.lower()
-        if stem == normalized:
-            return str(md_file.relative_to(notes_dir))
-    
-    return None
+            result = str(target.relative_to(notes_dir))
+            _remember_resolution(key, result)
+            return result
+
+    # Look up the stem index, rebuilding it if invalidated or for a new root
+    if _stem_index is None or _stem_index_dir != notes_dir:
+        _rebuild_stem_index(notes_dir)
+
+    result = _stem_index.get(normalized)
+    if result is None and time.monotonic() - _stem_index_built_at >= _STEM_INDEX_TTL:
+        # The miss may just mean the index predates the note; rebuild at
+        # most once per TTL and retry before giving up
+        _rebuild_stem_index(notes_dir)
+        result = _stem_index.get(normalized)
+
+    if result is not None:
+        _remember_resolution(key, result)
+    return result
+
+
+def _remember_resolution(key: tuple[str, str], result: str) -> None:
+    """Store a successful resolution, resetting the memo if it grows too big."""
+    if len(_resolve_memo) >= _RESOLVE_MEMO_MAX:
+        _resolve_memo.clear()
+    _resolve_memo[key] = result
 
 
 def build_file_tree(notes_dir: Path) -> dict:
     """
     Build a tree structure of the notes directory.
-    
+
     Args:
         notes_dir: Base directory for notes
-        
+
     Returns:
         Nested dict representing the file tree
     """
-    def build_node(path: Path, base: Path) -> dict | None:
-        # Skip hidden files and directories, and template files
-        if path.name.startswith(".") or path.name.endswith("_template.md"):
-            return None
-        
-        rel_path = str(path.relative_to(base))
-        
-        if path.is_file():
-            if not path.suffix == ".md":
-                return None
-            
-            # Parse frontmatter for metadata
-            try:
-                content = path.read_text()
-                frontmatter, _ = parse_frontmatter(content)
-            except Exception:
-                frontmatter = {}
-            
-            return {
-                "type": "file",
-                "name": path.stem,
-                "path": rel_path,
-                "metadata": frontmatter,
-            }
-        
-        elif path.is_dir():
-            children = []
-            for child in sorted(path.iterdir()):
-                node = build_node(child, base)
-                if node:
-                    children.append(node)
-            
-            # Skip empty directories
-            if not children:
-                return None
-            
-            return {
-                "type": "directory",
-                "name": path.name,
-                "path": rel_path,
-                "children": children,
-            }
-        
-        return None
-    
-    # Build tree from root
-    children = []
-    for child in sorted(notes_dir.iterdir()):
-        node = build_node(child, notes_dir)
-        if node:
-            children.append(node)
-    
+    def _walk(dir_path: str, rel: str) -> list[dict]:
+        # One scandir per directory: each DirEntry already knows its type
+        # and stat, so no extra is_file/is_dir syscalls or Path objects
+        with os.scandir(dir_path) as entries:
+            entries = sorted(entries, key=lambda e: e.name)
+
+        children = []
+        for entry in entries:
+            name = entry.name
+
+            # Skip hidden files and directories, and template files
+            if name.startswith(".") or name.endswith("_template.md"):
+                continue
+
+            rel_path = f"{rel}/{name}" if rel else name
+
+            if entry.is_dir(follow_symlinks=False):
+                sub_children = _walk(entry.path, rel_path)
+                # Skip empty directories
+                if sub_children:
+                    children.append({
+                        "type": "directory",
+                        "name": name,
+                        "path": rel_path,
+                        "children": sub_children,
+                    })
+            elif entry.is_file() and name.endswith(".md"):
+                # Parse frontmatter for metadata (cached until the file changes)
+                try:
+                    _, frontmatter, _ = get_note_meta(entry.path, entry.stat())
+                except Exception:
+                    frontmatter = {}
+
+                children.append({
+                    "type": "file",
+                    "name": name[:-3],
+                    "path": rel_path,
+                    "metadata": frontmatter,
+                })
+
+        return children
+
     return {
         "type": "directory",
         "name": "donna-data",
         "path": "",
-        "children": children,
+        "children": _walk(str(notes_dir), ""),
     }